@@ -1,32 +1,42 @@
 import streamlit as st
 import os
-import ast
-import re
-import pandas as pd
+import json
+import hashlib
+import html
+import csv
+import gzip
+import io
+import importlib.util
 from java_parser import extract_java_docs
 from sql_parser import extract_sql_docs
+from python_parser import parse_python_docs
+from js_parser import parse_js_docs
+from codebase_ingest import ingest_codebase, codebase_fingerprint, EXTENSIONS
+from function_metadata import extract_function_metadata_batch
 from architecture_map import generate_simple_diagram, generate_architecture_diagram, GRAPHVIZ_AVAILABLE
 from io import BytesIO
+from collections import Counter, defaultdict
+from functools import lru_cache
 from datetime import datetime
 
-# Try to import reportlab for PDF generation
-try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
-    from reportlab.lib import colors
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+# Heavy optional packages are only looked up here; they are imported where used
+# (generate_pdf, load_model, perform_search) to keep cold start fast.
+# pandas is likewise imported inside the code paths that build DataFrames.
+REPORTLAB_AVAILABLE = importlib.util.find_spec('reportlab') is not None
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec('sentence_transformers') is not None
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+# sentence-transformers' ONNX backend needs optimum with onnxruntime (pip install "optimum[onnxruntime]")
+ONNX_RUNTIME_AVAILABLE = (
+    importlib.util.find_spec('onnxruntime') is not None
+    and importlib.util.find_spec('optimum') is not None
+)
 
-# Try to import sentence_transformers, but make it optional
+# Try to import orjson for faster report serialization, falling back to json
 try:
-    from sentence_transformers import SentenceTransformer, util
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 # Configure the page with custom theme
 st.set_page_config(
@@ -36,806 +46,113 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_data
+def load_theme_css():
+    """Read the app theme stylesheet once; reruns reuse the cached string."""
+    css_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'theme.css')
+    with open(css_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@st.cache_data
+def load_report_css():
+    """Read the HTML report stylesheet once; every generated report inlines the cached string."""
+    css_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'report.css')
+    with open(css_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
 # Custom CSS for enhanced interactive theme
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Nunito:wght@300;400;600;700&family=Varela+Round&family=Indie+Flower&family=Space+Grotesk:wght@400;500;600;700&display=swap');
-    
-    /* Global Styles */
-    * {
-        font-family: 'Nunito', sans-serif;
-    }
-    
-    /* Main background with subtle pattern */
-    .stApp {
-        background-color: #FDFCFE;
-        background-image:
-            radial-gradient(circle at 20% 50%, rgba(232, 180, 240, 0.03) 0%, transparent 50%),
-            radial-gradient(circle at 80% 80%, rgba(168, 213, 255, 0.03) 0%, transparent 50%);
-    }
-    
-    /* Headings */
-    h1, h2, h3, h4, h5, h6 {
-        font-family: 'Space Grotesk', sans-serif;
-        color: #6B5B7B;
-        letter-spacing: -0.5px;
-    }
-    
-    /* Post-it Note with glow */
-    .postit-note {
-        background: linear-gradient(135deg, #FFF9C4 0%, #FFF59D 100%);
-        padding: 2rem;
-        border-radius: 8px;
-        box-shadow:
-            0 8px 32px rgba(255, 249, 196, 0.4),
-            0 2px 8px rgba(0, 0, 0, 0.1);
-        transform: rotate(-2deg);
-        max-width: 500px;
-        margin: 3rem auto;
-        font-family: 'Indie Flower', cursive;
-        font-size: 1.2rem;
-        line-height: 1.8;
-        color: #5D4037;
-        position: relative;
-        transition: all 0.3s ease;
-    }
-    
-    .postit-note:hover {
-        transform: rotate(0deg) translateY(-5px);
-        box-shadow:
-            0 12px 48px rgba(255, 249, 196, 0.5),
-            0 4px 12px rgba(0, 0, 0, 0.15);
-    }
-    
-    .postit-note::before {
-        content: '';
-        position: absolute;
-        top: -10px;
-        left: 50%;
-        transform: translateX(-50%);
-        width: 60px;
-        height: 20px;
-        background: rgba(255, 255, 255, 0.4);
-        border-radius: 2px;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-    }
-    
-    .logo-container {
-        text-align: center;
-        margin: 2rem auto;
-        animation: fadeInDown 0.8s ease-out;
-    }
-    
-    .logo-text {
-        font-size: 4.5rem;
-        font-family: 'Space Grotesk', sans-serif;
-        font-weight: 700;
-        background: linear-gradient(135deg, #E8B4F0 0%, #A8D5FF 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 0.5rem;
-        letter-spacing: -2px;
-        text-shadow: 0 0 40px rgba(232, 180, 240, 0.3);
-    }
-    
-    /* Interactive Cards */
-    .action-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 16px;
-        border: 2px solid transparent;
-        box-shadow:
-            0 4px 20px rgba(232, 180, 240, 0.1),
-            0 0 0 1px rgba(232, 180, 240, 0.1);
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        cursor: pointer;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .action-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: linear-gradient(135deg, rgba(232, 180, 240, 0.05) 0%, rgba(168, 213, 255, 0.05) 100%);
-        opacity: 0;
-        transition: opacity 0.3s ease;
-    }
-    
-    .action-card:hover {
-        transform: translateY(-8px);
-        border-color: #E8B4F0;
-        box-shadow:
-            0 12px 40px rgba(232, 180, 240, 0.25),
-            0 0 0 1px rgba(232, 180, 240, 0.2),
-            0 0 60px rgba(232, 180, 240, 0.15);
-    }
-    
-    .action-card:hover::before {
-        opacity: 1;
-    }
-    
-    /* Sidebar Styling */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #FFF5F8 0%, #F5F0FF 100%);
-        border-right: 2px solid #FFE5F1;
-    }
-    
-    [data-testid="stSidebar"] h1 {
-        color: #E8B4F0;
-        font-family: 'Poppins', sans-serif;
-        font-weight: 600;
-    }
-    
-    /* Card Styling */
-    .custom-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 20px;
-        box-shadow: 0 4px 20px rgba(232, 180, 240, 0.15);
-        margin-bottom: 1.5rem;
-        transition: all 0.3s ease;
-        border: 2px solid transparent;
-    }
-    
-    .custom-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 8px 30px rgba(232, 180, 240, 0.25);
-        border-color: #FFE5F1;
-    }
-    
-    /* Search Bar Styling with glow */
-    .search-container {
-        max-width: 700px;
-        margin: 2rem auto;
-        text-align: center;
-    }
-    
-    .stTextInput > div > div > input {
-        border-radius: 50px !important;
-        border: 2px solid #E8B4F0 !important;
-        padding: 1.2rem 2rem !important;
-        font-size: 1.1rem !important;
-        text-align: center !important;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        box-shadow:
-            0 4px 20px rgba(232, 180, 240, 0.15),
-            0 0 0 0 rgba(232, 180, 240, 0) !important;
-        background: white !important;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #A8D5FF !important;
-        box-shadow:
-            0 8px 32px rgba(168, 213, 255, 0.25),
-            0 0 40px rgba(168, 213, 255, 0.15),
-            0 0 0 4px rgba(168, 213, 255, 0.1) !important;
-        transform: translateY(-2px) !important;
-    }
-    
-    /* Enhanced Button Styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #FFB3D9 0%, #C9A3FF 100%);
-        color: white;
-        border: none;
-        border-radius: 16px;
-        padding: 0.9rem 2rem;
-        font-weight: 600;
-        font-size: 1rem;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        box-shadow:
-            0 4px 20px rgba(232, 180, 240, 0.3),
-            0 0 0 0 rgba(232, 180, 240, 0);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .stButton > button::before {
-        content: '';
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        width: 0;
-        height: 0;
-        border-radius: 50%;
-        background: rgba(255, 255, 255, 0.3);
-        transform: translate(-50%, -50%);
-        transition: width 0.6s, height 0.6s;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-4px);
-        box-shadow:
-            0 8px 32px rgba(232, 180, 240, 0.4),
-            0 0 60px rgba(232, 180, 240, 0.2);
-        background: linear-gradient(135deg, #FFC4E5 0%, #D9B3FF 100%);
-    }
-    
-    .stButton > button:hover::before {
-        width: 300px;
-        height: 300px;
-    }
-    
-    .stButton > button:active {
-        transform: translateY(-2px);
-    }
-    
-    /* Download Button Styling */
-    .stDownloadButton > button {
-        background: linear-gradient(135deg, #FFD4A3 0%, #FFE5F1 100%);
-        color: #6B5B7B;
-        border: none;
-        border-radius: 25px;
-        padding: 0.75rem 2rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 15px rgba(255, 212, 163, 0.3);
-    }
-    
-    .stDownloadButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 25px rgba(255, 212, 163, 0.4);
-    }
-    
-    /* File Uploader Styling */
-    [data-testid="stFileUploader"] {
-        background: white;
-        border-radius: 20px;
-        padding: 1.5rem;
-        border: 2px dashed #E8B4F0;
-        transition: all 0.3s ease;
-    }
-    
-    [data-testid="stFileUploader"]:hover {
-        border-color: #A8D5FF;
-        background: #FEFBFF;
-    }
-    
-    /* DataFrame Styling */
-    .stDataFrame {
-        border-radius: 15px;
-        overflow: hidden;
-        box-shadow: 0 4px 20px rgba(232, 180, 240, 0.15);
-    }
-    
-    /* Input Fields */
-    .stTextInput > div > div > input {
-        border-radius: 15px;
-        border: 2px solid #FFE5F1;
-        padding: 0.75rem 1rem;
-        transition: all 0.3s ease;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #E8B4F0;
-        box-shadow: 0 0 0 3px rgba(232, 180, 240, 0.1);
-    }
-    
-    /* Success/Info/Warning Messages */
-    .stSuccess {
-        background: linear-gradient(135deg, #D4FFE5 0%, #E5F8FF 100%);
-        border-radius: 15px;
-        border-left: 4px solid #A8FFD5;
-        padding: 1rem;
-    }
-    
-    .stInfo {
-        background: linear-gradient(135deg, #E5F8FF 0%, #F5F0FF 100%);
-        border-radius: 15px;
-        border-left: 4px solid #A8D5FF;
-        padding: 1rem;
-    }
-    
-    .stWarning {
-        background: linear-gradient(135deg, #FFF5E5 0%, #FFE5F1 100%);
-        border-radius: 15px;
-        border-left: 4px solid #FFD4A3;
-        padding: 1rem;
-    }
-    
-    /* Enhanced Metric Cards with glow */
-    [data-testid="stMetricValue"] {
-        font-size: 2.5rem !important;
-        font-weight: 700 !important;
-        background: linear-gradient(135deg, #E8B4F0 0%, #A8D5FF 100%);
-        -webkit-background-clip: text !important;
-        -webkit-text-fill-color: transparent !important;
-    }
-    
-    [data-testid="stMetric"] {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 16px;
-        box-shadow:
-            0 4px 20px rgba(232, 180, 240, 0.1),
-            0 0 0 1px rgba(232, 180, 240, 0.1);
-        transition: all 0.3s ease;
-    }
-    
-    [data-testid="stMetric"]:hover {
-        transform: translateY(-5px);
-        box-shadow:
-            0 8px 32px rgba(232, 180, 240, 0.2),
-            0 0 60px rgba(232, 180, 240, 0.1);
-    }
-    
-    /* Enhanced DataFrame styling */
-    .stDataFrame {
-        border-radius: 16px !important;
-        overflow: hidden !important;
-        box-shadow:
-            0 4px 20px rgba(232, 180, 240, 0.15),
-            0 0 0 1px rgba(232, 180, 240, 0.1) !important;
-    }
-    
-    /* Divider */
-    hr {
-        border: none;
-        height: 2px;
-        background: linear-gradient(90deg, transparent, #FFE5F1, transparent);
-        margin: 2rem 0;
-    }
-    
-    /* Animations */
-    @keyframes fadeIn {
-        from {
-            opacity: 0;
-            transform: translateY(20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    @keyframes fadeInDown {
-        from {
-            opacity: 0;
-            transform: translateY(-30px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    @keyframes pulse {
-        0%, 100% {
-            opacity: 1;
-        }
-        50% {
-            opacity: 0.8;
-        }
-    }
-    
-    @keyframes glow {
-        0%, 100% {
-            box-shadow: 0 0 20px rgba(232, 180, 240, 0.3);
-        }
-        50% {
-            box-shadow: 0 0 40px rgba(232, 180, 240, 0.5);
-        }
-    }
-    
-    /* Icon Styling */
-    .icon {
-        font-size: 2rem;
-        margin-bottom: 0.5rem;
-        animation: pulse 2s infinite;
-    }
-    
-    /* Section Headers */
-    h1, h2, h3 {
-        font-family: 'Poppins', sans-serif;
-        color: #6B5B7B;
-        font-weight: 600;
-    }
-    
-    /* Subheader with icon */
-    .section-header {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        margin-bottom: 1rem;
-    }
-    
-    /* Feature Cards */
-    .feature-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 20px;
-        text-align: center;
-        box-shadow: 0 4px 20px rgba(232, 180, 240, 0.15);
-        transition: all 0.3s ease;
-    }
-    
-    .feature-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 8px 30px rgba(232, 180, 240, 0.25);
-    }
-    
-    .feature-icon {
-        font-size: 3rem;
-        margin-bottom: 1rem;
-    }
-    
-    /* Accessibility - High Contrast Mode Support */
-    @media (prefers-contrast: high) {
-        .stApp {
-            background: white;
-        }
-        .custom-card {
-            border: 2px solid #6B5B7B;
-        }
-    }
-    
-    /* Responsive Design */
-    @media (max-width: 768px) {
-        .hero-title {
-            font-size: 2.5rem;
-        }
-        .hero-subtitle {
-            font-size: 1.1rem;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>\n{load_theme_css()}</style>", unsafe_allow_html=True)
+
+_EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+# On-disk FP16 embeddings, one .npy per source file keyed by model and texts;
+# set DOCGEN_NOCACHE to bypass
+_EMBEDDING_CACHE_DIR = os.path.join('.cache', 'embeddings')
+
 
 # Load the sentence transformer model
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def load_model():
     """Load the sentence transformer model for semantic search."""
     if not SENTENCE_TRANSFORMERS_AVAILABLE:
         return None
-    return SentenceTransformer('all-MiniLM-L6-v2')
-
-
-def generate_usage_template(func_name, params, language='python'):
-    """
-    Generate a usage example template for a function.
     
-    Args:
-        func_name (str): Name of the function
-        params (list): List of parameter names
-        language (str): Programming language ('python', 'javascript', 'java', 'sql')
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
     
-    Returns:
-        str: Usage example template
-    """
-    if not params:
-        params = []
-    
-    # Create parameter placeholders
-    param_placeholders = []
-    for param in params:
-        # Remove default values and type hints
-        clean_param = param.split('=')[0].split(':')[0].strip()
-        if clean_param and clean_param not in ['self', 'cls']:
-            param_placeholders.append(clean_param)
-    
-    params_str = ', '.join(param_placeholders) if param_placeholders else ''
-    
-    # Generate language-specific templates
-    if language == 'python':
-        return f"""# Example usage:
-result = {func_name}({params_str})
-print(result)"""
-    
-    elif language == 'javascript':
-        return f"""// Example usage:
-const result = {func_name}({params_str});
-console.log(result);"""
-    
-    elif language == 'java':
-        return f"""// Example usage:
-Object result = {func_name}({params_str});
-System.out.println(result);"""
-    
-    elif language == 'sql':
-        if params_str:
-            return f"""-- Example usage:
-SELECT {func_name}({params_str});"""
-        else:
-            return f"""-- Example usage:
-CALL {func_name}();"""
+    import torch
+    use_cuda = torch.cuda.is_available()
     
-    else:
-        return f"// Example: {func_name}({params_str})"
+    if not use_cuda:
+        # CPU encodes scale to about 8 intra-op threads; beyond that they oversubscribe
+        torch.set_num_threads(min(8, os.cpu_count() or 1))
+        try:
+            # Only allowed before any inter-op parallel work has started
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass
+    
+    # ONNX Runtime encodes faster than PyTorch on CPU; fall back to PyTorch if the
+    # installed sentence-transformers predates the backend option or export fails
+    if ONNX_RUNTIME_AVAILABLE and not use_cuda:
+        try:
+            return SentenceTransformer(_EMBEDDING_MODEL, backend='onnx')
+        except Exception as e:
+            print(f"ONNX backend unavailable, using PyTorch: {str(e)}")
+    
+    model = SentenceTransformer(_EMBEDDING_MODEL)
+    if model.device.type == 'cuda':
+        model.half()
+    return model
 
 
-def extract_function_metadata(source_code, language='python', limit=5):
-    """
-    Extract detailed metadata for functions including source code and usage examples.
-    
-    Args:
-        source_code (str): Source code to parse
-        language (str): Programming language
-        limit (int): Maximum number of functions to extract (default: 5)
-    
-    Returns:
-        list: List of function metadata dictionaries
-    """
-    functions = []
-    
-    try:
-        if language == 'python':
-            # Parse Python using AST
-            tree = ast.parse(source_code)
-            lines = source_code.split('\n')
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    # Extract function name
-                    func_name = node.name
-                    
-                    # Extract parameters
-                    params = []
-                    for arg in node.args.args:
-                        param_name = arg.arg
-                        # Include type annotation if present
-                        if arg.annotation:
-                            param_name += f": {ast.unparse(arg.annotation)}"
-                        params.append(param_name)
-                    
-                    # Extract docstring
-                    docstring = ast.get_docstring(node) or "No documentation available"
-                    
-                    # Extract function body source code
-                    start_line = node.lineno - 1
-                    end_line = node.end_lineno if hasattr(node, 'end_lineno') else start_line + 1
-                    source_body = '\n'.join(lines[start_line:end_line])
-                    
-                    # Generate usage example
-                    usage_example = generate_usage_template(func_name, params, 'python')
-                    
-                    functions.append({
-                        'name': func_name,
-                        'params': params,
-                        'docstring': docstring,
-                        'source_code': source_body,
-                        'usage_example': usage_example,
-                        'language': 'python',
-                        'type': 'function'
-                    })
-                    
-                    if len(functions) >= limit:
-                        break
-        
-        elif language == 'javascript':
-            lines = source_code.split('\n')
-            
-            # Regular function pattern
-            func_pattern = r'function\s+(\w+)\s*\((.*?)\)\s*\{'
-            matches = list(re.finditer(func_pattern, source_code))
-            
-            for match in matches[:limit]:
-                func_name = match.group(1)
-                params_str = match.group(2)
-                params = [p.strip() for p in params_str.split(',') if p.strip()]
-                
-                # Find function body
-                start_pos = match.start()
-                start_line = source_code[:start_pos].count('\n')
-                
-                # Find matching closing brace
-                brace_count = 1
-                pos = match.end()
-                while pos < len(source_code) and brace_count > 0:
-                    if source_code[pos] == '{':
-                        brace_count += 1
-                    elif source_code[pos] == '}':
-                        brace_count -= 1
-                    pos += 1
-                
-                end_line = source_code[:pos].count('\n')
-                source_body = '\n'.join(lines[start_line:end_line + 1])
-                
-                # Try to find JSDoc comment
-                before_func = source_code[:start_pos]
-                jsdoc_pattern = r'/\*\*(.*?)\*/'
-                jsdoc_matches = list(re.finditer(jsdoc_pattern, before_func, re.DOTALL))
-                docstring = "No documentation available"
-                if jsdoc_matches:
-                    last_jsdoc = jsdoc_matches[-1].group(1).strip()
-                    docstring = '\n'.join(line.strip().lstrip('*').strip() for line in last_jsdoc.split('\n'))
-                
-                usage_example = generate_usage_template(func_name, params, 'javascript')
-                
-                functions.append({
-                    'name': func_name,
-                    'params': params,
-                    'docstring': docstring,
-                    'source_code': source_body,
-                    'usage_example': usage_example,
-                    'language': 'javascript',
-                    'type': 'function'
-                })
-            
-            # Arrow functions
-            arrow_pattern = r'const\s+(\w+)\s*=\s*\((.*?)\)\s*=>'
-            arrow_matches = list(re.finditer(arrow_pattern, source_code))
-            
-            for match in arrow_matches[:max(0, limit - len(functions))]:
-                func_name = match.group(1)
-                params_str = match.group(2)
-                params = [p.strip() for p in params_str.split(',') if p.strip()]
-                
-                start_pos = match.start()
-                start_line = source_code[:start_pos].count('\n')
-                
-                # Find end of arrow function (semicolon or newline)
-                end_pos = source_code.find(';', match.end())
-                if end_pos == -1:
-                    end_pos = source_code.find('\n\n', match.end())
-                if end_pos == -1:
-                    end_pos = len(source_code)
-                
-                end_line = source_code[:end_pos].count('\n')
-                source_body = '\n'.join(lines[start_line:end_line + 1])
-                
-                usage_example = generate_usage_template(func_name, params, 'javascript')
-                
-                functions.append({
-                    'name': func_name,
-                    'params': params,
-                    'docstring': "Arrow function - No documentation available",
-                    'source_code': source_body,
-                    'usage_example': usage_example,
-                    'language': 'javascript',
-                    'type': 'function'
-                })
-        
-        elif language == 'java':
-            lines = source_code.split('\n')
-            
-            # Java method pattern
-            method_pattern = r'(public|private|protected)?\s*(static)?\s*(\w+)\s+(\w+)\s*\((.*?)\)\s*\{'
-            matches = list(re.finditer(method_pattern, source_code))
-            
-            for match in matches[:limit]:
-                func_name = match.group(4)
-                params_str = match.group(5)
-                
-                # Parse parameters
-                params = []
-                if params_str.strip():
-                    for param in params_str.split(','):
-                        param = param.strip()
-                        if param:
-                            # Extract parameter name (last word)
-                            parts = param.split()
-                            if parts:
-                                params.append(parts[-1])
-                
-                start_pos = match.start()
-                start_line = source_code[:start_pos].count('\n')
-                
-                # Find matching closing brace
-                brace_count = 1
-                pos = match.end()
-                while pos < len(source_code) and brace_count > 0:
-                    if source_code[pos] == '{':
-                        brace_count += 1
-                    elif source_code[pos] == '}':
-                        brace_count -= 1
-                    pos += 1
-                
-                end_line = source_code[:pos].count('\n')
-                source_body = '\n'.join(lines[start_line:end_line + 1])
-                
-                # Try to find Javadoc comment
-                before_method = source_code[:start_pos]
-                javadoc_pattern = r'/\*\*(.*?)\*/'
-                javadoc_matches = list(re.finditer(javadoc_pattern, before_method, re.DOTALL))
-                docstring = "No documentation available"
-                if javadoc_matches:
-                    last_javadoc = javadoc_matches[-1].group(1).strip()
-                    docstring = '\n'.join(line.strip().lstrip('*').strip() for line in last_javadoc.split('\n'))
-                
-                usage_example = generate_usage_template(func_name, params, 'java')
-                
-                functions.append({
-                    'name': func_name,
-                    'params': params,
-                    'docstring': docstring,
-                    'source_code': source_body,
-                    'usage_example': usage_example,
-                    'language': 'java',
-                    'type': 'method'
-                })
-        
-        elif language == 'sql':
-            lines = source_code.split('\n')
-            
-            # SQL function/procedure pattern
-            func_pattern = r'CREATE\s+(FUNCTION|PROCEDURE)\s+(\w+)\s*\((.*?)\)'
-            matches = list(re.finditer(func_pattern, source_code, re.IGNORECASE | re.DOTALL))
-            
-            for match in matches[:limit]:
-                func_type = match.group(1).upper()
-                func_name = match.group(2)
-                params_str = match.group(3)
-                
-                # Parse parameters
-                params = []
-                if params_str.strip():
-                    for param in params_str.split(','):
-                        param = param.strip()
-                        if param:
-                            # Extract parameter name (first word)
-                            parts = param.split()
-                            if parts:
-                                params.append(parts[0])
-                
-                start_pos = match.start()
-                start_line = source_code[:start_pos].count('\n')
-                
-                # Find END statement
-                end_pattern = r'END\s*;'
-                end_match = re.search(end_pattern, source_code[match.end():], re.IGNORECASE)
-                if end_match:
-                    end_pos = match.end() + end_match.end()
-                    end_line = source_code[:end_pos].count('\n')
-                else:
-                    end_line = min(start_line + 20, len(lines) - 1)
-                
-                source_body = '\n'.join(lines[start_line:end_line + 1])
-                
-                usage_example = generate_usage_template(func_name, params, 'sql')
-                
-                functions.append({
-                    'name': func_name,
-                    'params': params,
-                    'docstring': f"SQL {func_type}",
-                    'source_code': source_body,
-                    'usage_example': usage_example,
-                    'language': 'sql',
-                    'type': func_type.lower()
-                })
-    
-    except Exception as e:
-        print(f"Error extracting function metadata: {str(e)}")
-    
-    return functions
+# Upper bound on characters per token when clipping texts before encoding
+_MAX_CHARS_PER_TOKEN = 8
 
 
-def generate_html_report(processed_data, output_file='function_report.html'):
+def encode_smart(model, sentences, batch_size=1024):
     """
-    Generate an interactive HTML report with split-screen layout.
+    Encode sentences in large length-grouped batches.
+    
+    SentenceTransformer.encode already sorts its inputs by length before batching
+    and restores the original order, so padding stays minimal within each batch.
+    Texts are clipped well past the model's token limit first, since tokenizing
+    text the model would truncate anyway is wasted work.
     
     Args:
-        processed_data (list): Output from process_files() function
-        output_file (str): Output HTML file name
+        model: Loaded SentenceTransformer
+        sentences (list): Texts to encode
+        batch_size (int): Number of texts per forward pass
     
     Returns:
-        str: Path to the generated HTML file
+        torch.Tensor: One unit-length embedding row per sentence, in input order
     """
-    import html
-    import json
-    from datetime import datetime
-    
-    # Prepare data for JavaScript
-    functions_data = []
-    for file_data in processed_data:
-        for func in file_data['functions']:
-            functions_data.append({
-                'file': file_data['file_name'],
-                'file_path': file_data['file_path'],
-                'language': file_data['language'],
-                'name': func['name'],
-                'params': func['params'],
-                'docstring': func['docstring'],
-                'usage_example': func['usage_example'],
-                'source_code': func['source_code'],
-                'type': func['type']
-            })
-    
-    # Generate HTML
-    html_content = f'''<!DOCTYPE html>
+    # Tokens average well under 8 characters, so the cut lands past the point the model truncates at
+    max_chars = (getattr(model, 'max_seq_length', None) or 256) * _MAX_CHARS_PER_TOKEN
+    return model.encode(
+        [sentence[:max_chars] for sentence in sentences],
+        batch_size=batch_size,
+        convert_to_tensor=True,
+        normalize_embeddings=True,
+        show_progress_bar=False
+    )
+
+
+def _json_dumps(obj):
+    """Serialize obj to compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+# Static pieces of the interactive HTML report. generate_html_report streams them
+# around the stylesheet from assets/report.css, the generation timestamp and the
+# two JSON data blocks.
+_HTML_REPORT_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -844,359 +161,9 @@ def generate_html_report(processed_data, output_file='function_report.html'):
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github-dark.min.css">
     <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
     <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            height: 100vh;
-            overflow: hidden;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        }}
-        
-        .container {{
-            display: flex;
-            height: 100vh;
-            background: white;
-        }}
-        
-        /* Left Panel - Navigation */
-        .left-panel {{
-            width: 350px;
-            background: linear-gradient(180deg, #f8f9fa 0%, #e9ecef 100%);
-            border-right: 2px solid #dee2e6;
-            overflow-y: auto;
-            box-shadow: 2px 0 10px rgba(0,0,0,0.1);
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px;
-            text-align: center;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.2);
-        }}
-        
-        .header h1 {{
-            font-size: 24px;
-            margin-bottom: 5px;
-        }}
-        
-        .header p {{
-            font-size: 12px;
-            opacity: 0.9;
-        }}
-        
-        .search-box {{
-            padding: 15px;
-            background: white;
-            border-bottom: 1px solid #dee2e6;
-        }}
-        
-        .search-box input {{
-            width: 100%;
-            padding: 10px;
-            border: 2px solid #e9ecef;
-            border-radius: 8px;
-            font-size: 14px;
-            transition: all 0.3s;
-        }}
-        
-        .search-box input:focus {{
-            outline: none;
-            border-color: #667eea;
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        }}
-        
-        .file-group {{
-            margin: 10px;
-        }}
-        
-        .file-header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 12px 15px;
-            border-radius: 8px;
-            cursor: pointer;
-            font-weight: 600;
-            font-size: 14px;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            transition: all 0.3s;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-        
-        .file-header:hover {{
-            transform: translateX(5px);
-            box-shadow: 0 4px 10px rgba(0,0,0,0.15);
-        }}
-        
-        .file-header .icon {{
-            font-size: 18px;
-        }}
-        
-        .file-header .count {{
-            margin-left: auto;
-            background: rgba(255,255,255,0.2);
-            padding: 2px 8px;
-            border-radius: 12px;
-            font-size: 12px;
-        }}
-        
-        .function-list {{
-            background: white;
-            margin: 5px 10px 10px 10px;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.05);
-        }}
-        
-        .function-item {{
-            padding: 12px 15px;
-            cursor: pointer;
-            border-bottom: 1px solid #f8f9fa;
-            transition: all 0.2s;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .function-item:last-child {{
-            border-bottom: none;
-        }}
-        
-        .function-item:hover {{
-            background: linear-gradient(90deg, #f8f9fa 0%, #e9ecef 100%);
-            padding-left: 20px;
-        }}
-        
-        .function-item.active {{
-            background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            font-weight: 600;
-        }}
-        
-        .function-item .type-badge {{
-            background: #667eea;
-            color: white;
-            padding: 2px 8px;
-            border-radius: 4px;
-            font-size: 10px;
-            text-transform: uppercase;
-        }}
-        
-        .function-item.active .type-badge {{
-            background: rgba(255,255,255,0.3);
-        }}
-        
-        .function-item .name {{
-            flex: 1;
-            font-family: 'Courier New', monospace;
-            font-size: 13px;
-        }}
-        
-        /* Right Panel - Details */
-        .right-panel {{
-            flex: 1;
-            overflow-y: auto;
-            background: #ffffff;
-        }}
-        
-        .welcome {{
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            height: 100%;
-            text-align: center;
-            padding: 40px;
-            color: #6c757d;
-        }}
-        
-        .welcome .icon {{
-            font-size: 80px;
-            margin-bottom: 20px;
-            opacity: 0.3;
-        }}
-        
-        .welcome h2 {{
-            font-size: 28px;
-            margin-bottom: 10px;
-            color: #495057;
-        }}
-        
-        .welcome p {{
-            font-size: 16px;
-            max-width: 500px;
-        }}
-        
-        .detail-view {{
-            display: none;
-            padding: 30px;
-            animation: fadeIn 0.3s;
-        }}
-        
-        @keyframes fadeIn {{
-            from {{ opacity: 0; transform: translateY(10px); }}
-            to {{ opacity: 1; transform: translateY(0); }}
-        }}
-        
-        .detail-header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 25px;
-            border-radius: 12px;
-            margin-bottom: 25px;
-            box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-        }}
-        
-        .detail-header h2 {{
-            font-size: 32px;
-            margin-bottom: 10px;
-            font-family: 'Courier New', monospace;
-        }}
-        
-        .detail-header .meta {{
-            display: flex;
-            gap: 15px;
-            flex-wrap: wrap;
-            margin-top: 15px;
-        }}
-        
-        .detail-header .meta-item {{
-            background: rgba(255,255,255,0.2);
-            padding: 5px 12px;
-            border-radius: 6px;
-            font-size: 13px;
-        }}
-        
-        .section {{
-            background: white;
-            border: 2px solid #e9ecef;
-            border-radius: 12px;
-            padding: 25px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-            transition: all 0.3s;
-        }}
-        
-        .section:hover {{
-            box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-            transform: translateY(-2px);
-        }}
-        
-        .section-title {{
-            font-size: 20px;
-            font-weight: 600;
-            margin-bottom: 15px;
-            color: #495057;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #e9ecef;
-        }}
-        
-        .section-title .icon {{
-            font-size: 24px;
-        }}
-        
-        .section-content {{
-            color: #6c757d;
-            line-height: 1.8;
-            font-size: 15px;
-        }}
-        
-        .code-block {{
-            background: #1e1e1e;
-            border-radius: 8px;
-            padding: 20px;
-            overflow-x: auto;
-            margin-top: 10px;
-        }}
-        
-        .code-block pre {{
-            margin: 0;
-            font-family: 'Courier New', monospace;
-            font-size: 14px;
-            line-height: 1.6;
-        }}
-        
-        .code-block code {{
-            color: #d4d4d4;
-        }}
-        
-        .params-list {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 8px;
-            margin-top: 10px;
-        }}
-        
-        .param-badge {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 6px 12px;
-            border-radius: 6px;
-            font-family: 'Courier New', monospace;
-            font-size: 13px;
-            box-shadow: 0 2px 5px rgba(102, 126, 234, 0.3);
-        }}
-        
-        /* Language Icons */
-        .lang-python {{ color: #3776ab; }}
-        .lang-javascript {{ color: #f7df1e; }}
-        .lang-java {{ color: #007396; }}
-        .lang-sql {{ color: #00758f; }}
-        
-        /* Scrollbar Styling */
-        ::-webkit-scrollbar {{
-            width: 10px;
-            height: 10px;
-        }}
-        
-        ::-webkit-scrollbar-track {{
-            background: #f1f1f1;
-        }}
-        
-        ::-webkit-scrollbar-thumb {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            border-radius: 5px;
-        }}
-        
-        ::-webkit-scrollbar-thumb:hover {{
-            background: linear-gradient(135deg, #764ba2 0%, #667eea 100%);
-        }}
-        
-        /* Stats Bar */
-        .stats-bar {{
-            background: linear-gradient(90deg, #f8f9fa 0%, #e9ecef 100%);
-            padding: 15px;
-            display: flex;
-            justify-content: space-around;
-            border-bottom: 2px solid #dee2e6;
-        }}
-        
-        .stat-item {{
-            text-align: center;
-        }}
-        
-        .stat-value {{
-            font-size: 24px;
-            font-weight: 700;
-            color: #667eea;
-        }}
-        
-        .stat-label {{
-            font-size: 12px;
-            color: #6c757d;
-            text-transform: uppercase;
-        }}
-    </style>
+'''
+
+_HTML_REPORT_HEADER = '''    </style>
 </head>
 <body>
     <div class="container">
@@ -1204,7 +171,9 @@ def generate_html_report(processed_data, output_file='function_report.html'):
         <div class="left-panel">
             <div class="header">
                 <h1>✨ Function Explorer</h1>
-                <p>Generated on {datetime.now().strftime("%B %d, %Y at %I:%M %p")}</p>
+                <p>Generated on '''
+
+_HTML_REPORT_BODY = '''</p>
             </div>
             
             <div class="stats-bar">
@@ -1227,6 +196,24 @@ def generate_html_report(processed_data, output_file='function_report.html'):
             </div>
             
             <div id="navigation-tree"></div>
+            
+            <!-- Row templates cloned by renderNavigationTree -->
+            <template id="tpl-file">
+                <div class="file-group">
+                    <div class="file-header">
+                        <span class="icon"></span>
+                        <span class="file-name"></span>
+                        <span class="count"></span>
+                    </div>
+                    <div class="function-list"></div>
+                </div>
+            </template>
+            <template id="tpl-func">
+                <div class="function-item">
+                    <span class="type-badge"></span>
+                    <span class="name"></span>
+                </div>
+            </template>
         </div>
         
         <!-- Right Panel -->
@@ -1283,71 +270,118 @@ def generate_html_report(processed_data, output_file='function_report.html'):
         </div>
     </div>
     
+    <!-- Per-function details, parsed on first click rather than at load -->
+    <script type="application/json" id="functions-payload">'''
+
+_HTML_REPORT_SCRIPT = '''</script>
+    
+    <!-- Function index, read with JSON.parse rather than as a JS literal -->
+    <script type="application/json" id="functions-index">'''
+
+_HTML_REPORT_TAIL = '''</script>
+    
     <script>
-        // Function data
-        const functionsData = {json.dumps(functions_data, indent=8)};
+        // Function index; details live in the functions-payload block
+        const functionsData = JSON.parse(document.getElementById('functions-index').textContent);
+        
+        // File group icons by language
+        const LANG_ICONS = Object.freeze({
+            'python': '🐍',
+            'javascript': '📜',
+            'java': '☕',
+            'sql': '🗄️'
+        });
+        const DEFAULT_ICON = '📄';
+        
+        // Search index of {el, name} built once while rendering the tree
+        const searchIndex = [];
+        
+        // Details payload, parsed lazily on the first function click
+        let functionsPayload = null;
+        
+        // Currently selected navigation row
+        let activeItem = null;
+        
+        // Highlighted markup per function id, and a counter to drop stale idle work
+        const highlightCache = new Map();
+        let highlightToken = 0;
+        
+        // Sources longer than this are highlighted off the click path
+        const LARGE_SOURCE_CHARS = 20000;
+        
+        function getFunctionDetails(id) {
+            if (functionsPayload === null) {
+                functionsPayload = JSON.parse(document.getElementById('functions-payload').textContent);
+            }
+            return functionsPayload[id];
+        }
         
         // Initialize
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             renderNavigationTree();
             updateStats();
             setupSearch();
-        }});
+            setupScrollHint();
+        });
         
-        function renderNavigationTree() {{
+        function renderNavigationTree() {
             const tree = document.getElementById('navigation-tree');
-            const fileGroups = {{}};
+            const fileGroups = {};
             
             // Group functions by file
-            functionsData.forEach(func => {{
-                if (!fileGroups[func.file]) {{
-                    fileGroups[func.file] = {{
+            functionsData.forEach(func => {
+                if (!fileGroups[func.file]) {
+                    fileGroups[func.file] = {
                         language: func.language,
                         functions: []
-                    }};
-                }}
+                    };
+                }
                 fileGroups[func.file].functions.push(func);
-            }});
+            });
+            
+            const fileTemplate = document.getElementById('tpl-file').content.firstElementChild;
+            const funcTemplate = document.getElementById('tpl-func').content.firstElementChild;
+            
+            // Build the whole tree off-document and attach it in one append
+            const frag = document.createDocumentFragment();
             
             // Render each file group
-            Object.keys(fileGroups).sort().forEach(fileName => {{
+            Object.keys(fileGroups).sort().forEach(fileName => {
                 const group = fileGroups[fileName];
-                const langIcon = getLangIcon(group.language);
-                
-                const fileDiv = document.createElement('div');
-                fileDiv.className = 'file-group';
-                fileDiv.innerHTML = `
-                    <div class="file-header">
-                        <span class="icon">${{langIcon}}</span>
-                        <span>${{fileName}}</span>
-                        <span class="count">${{group.functions.length}}</span>
-                    </div>
-                    <div class="function-list" id="list-${{fileName.replace(/[^a-zA-Z0-9]/g, '_')}}">
-                    </div>
-                `;
                 
-                tree.appendChild(fileDiv);
+                const fileDiv = fileTemplate.cloneNode(true);
+                fileDiv.querySelector('.icon').textContent = LANG_ICONS[group.language] || DEFAULT_ICON;
+                fileDiv.querySelector('.file-name').textContent = fileName;
+                fileDiv.querySelector('.count').textContent = group.functions.length;
                 
                 const funcList = fileDiv.querySelector('.function-list');
-                group.functions.forEach((func, index) => {{
-                    const funcItem = document.createElement('div');
-                    funcItem.className = 'function-item';
-                    funcItem.innerHTML = `
-                        <span class="type-badge">${{func.type}}</span>
-                        <span class="name">${{func.name}}</span>
-                    `;
+                funcList.id = `list-${fileName.replace(/[^a-zA-Z0-9]/g, '_')}`;
+                
+                group.functions.forEach(func => {
+                    const funcItem = funcTemplate.cloneNode(true);
+                    funcItem.dataset.name = func.name.toLowerCase();
+                    funcItem.querySelector('.type-badge').textContent = func.type;
+                    funcItem.querySelector('.name').textContent = func.name;
                     funcItem.onclick = () => showFunctionDetails(func, funcItem);
                     funcList.appendChild(funcItem);
-                }});
-            }});
-        }}
+                    searchIndex.push({el: funcItem, name: funcItem.dataset.name});
+                });
+                
+                frag.appendChild(fileDiv);
+            });
+            
+            tree.appendChild(frag);
+        }
         
-        function showFunctionDetails(func, element) {{
-            // Update active state
-            document.querySelectorAll('.function-item').forEach(item => {{
-                item.classList.remove('active');
-            }});
+        function showFunctionDetails(func, element) {
+            const details = getFunctionDetails(func.id);
+            
+            // Update active state on the previous and new rows only
+            if (activeItem) {
+                activeItem.classList.remove('active');
+            }
             element.classList.add('active');
+            activeItem = element;
             
             // Hide welcome, show details
             document.getElementById('welcome-view').style.display = 'none';
@@ -1359,81 +393,210 @@ def generate_html_report(processed_data, output_file='function_report.html'):
             document.getElementById('func-language').textContent = func.language.toUpperCase();
             document.getElementById('func-type').textContent = func.type.toUpperCase();
             
-            // Parameters
-            const paramsDiv = document.getElementById('func-params');
-            paramsDiv.innerHTML = '';
-            if (func.params && func.params.length > 0) {{
-                func.params.forEach(param => {{
-                    const badge = document.createElement('div');
-                    badge.className = 'param-badge';
-                    badge.textContent = param;
-                    paramsDiv.appendChild(badge);
-                }});
-            }} else {{
-                paramsDiv.innerHTML = '<div class="param-badge">No parameters</div>';
-            }}
+            // Parameters, built off-document and swapped in with one write
+            const params = details.params && details.params.length > 0 ? details.params : ['No parameters'];
+            const badges = document.createDocumentFragment();
+            params.forEach(param => {
+                const badge = document.createElement('div');
+                badge.className = 'param-badge';
+                badge.textContent = param;
+                badges.appendChild(badge);
+            });
+            document.getElementById('func-params').replaceChildren(badges);
             
             // Explanation
-            document.getElementById('func-explanation').textContent = func.docstring;
+            document.getElementById('func-explanation').textContent = details.docstring;
             
-            // Usage example
+            // Usage example and source code, highlighted only in these two blocks
             const usageCode = document.getElementById('func-usage');
-            usageCode.textContent = func.usage_example;
-            usageCode.className = `language-${{func.language}}`;
-            
-            // Source code
             const sourceCode = document.getElementById('func-source');
-            sourceCode.textContent = func.source_code;
-            sourceCode.className = `language-${{func.language}}`;
+            const token = ++highlightToken;
+            const cached = highlightCache.get(func.id);
             
-            // Apply syntax highlighting
-            hljs.highlightAll();
+            if (cached) {
+                // Revisited function: reuse the highlighted markup
+                usageCode.className = `language-${func.language} hljs`;
+                usageCode.innerHTML = cached.usageHTML;
+                sourceCode.className = `language-${func.language} hljs`;
+                sourceCode.innerHTML = cached.sourceHTML;
+            } else {
+                highlightBlock(usageCode, details.usage_example, func.language);
+                
+                const highlightSource = () => {
+                    // Skip if another function was opened in the meantime
+                    if (token !== highlightToken) return;
+                    highlightBlock(sourceCode, details.source_code, func.language);
+                    highlightCache.set(func.id, {
+                        usageHTML: usageCode.innerHTML,
+                        sourceHTML: sourceCode.innerHTML
+                    });
+                };
+                
+                if (details.source_code.length > LARGE_SOURCE_CHARS) {
+                    // Paint the plain source now and highlight it when the browser is idle
+                    sourceCode.className = `language-${func.language}`;
+                    sourceCode.textContent = details.source_code;
+                    (window.requestIdleCallback || setTimeout)(highlightSource);
+                } else {
+                    highlightSource();
+                }
+            }
             
             // Scroll to top
             document.querySelector('.right-panel').scrollTop = 0;
-        }}
+        }
+        
+        function setupScrollHint() {
+            const panel = document.querySelector('.right-panel');
+            let scrollTimer = null;
+            let pending = false;
+            
+            const endScroll = () => {
+                clearTimeout(scrollTimer);
+                panel.classList.remove('scrolling');
+            };
+            
+            // Add the class at most once per frame; clear it on scrollend, or after
+            // a quiet period in browsers without that event
+            panel.addEventListener('scroll', () => {
+                clearTimeout(scrollTimer);
+                scrollTimer = setTimeout(endScroll, 150);
+                if (pending) return;
+                pending = true;
+                requestAnimationFrame(() => {
+                    pending = false;
+                    panel.classList.add('scrolling');
+                });
+            }, {passive: true});
+            panel.addEventListener('scrollend', endScroll);
+        }
+        
+        function highlightBlock(element, text, language) {
+            element.className = `language-${language}`;
+            element.textContent = text;
+            delete element.dataset.highlighted;
+            hljs.highlightElement(element);
+        }
         
-        function updateStats() {{
+        function updateStats() {
             const files = new Set(functionsData.map(f => f.file));
             const languages = new Set(functionsData.map(f => f.language));
             
             document.getElementById('total-files').textContent = files.size;
             document.getElementById('total-functions').textContent = functionsData.length;
             document.getElementById('total-languages').textContent = languages.size;
-        }}
+        }
         
-        function setupSearch() {{
+        function setupSearch() {
             const searchInput = document.getElementById('search-input');
-            searchInput.addEventListener('input', function(e) {{
-                const query = e.target.value.toLowerCase();
-                document.querySelectorAll('.function-item').forEach(item => {{
-                    const name = item.querySelector('.name').textContent.toLowerCase();
-                    if (name.includes(query)) {{
-                        item.style.display = 'flex';
-                    }} else {{
-                        item.style.display = 'none';
-                    }}
-                }});
-            }});
-        }}
-        
-        function getLangIcon(language) {{
-            const icons = {{
-                'python': '🐍',
-                'javascript': '📜',
-                'java': '☕',
-                'sql': '🗄️'
-            }};
-            return icons[language] || '📄';
-        }}
+            let lastQuery = '';
+            let pending = false;
+            
+            // Coalesce rapid keystrokes into one filter pass per frame
+            searchInput.addEventListener('input', function() {
+                if (pending) return;
+                pending = true;
+                requestAnimationFrame(() => {
+                    pending = false;
+                    const query = searchInput.value.toLowerCase();
+                    if (query === lastQuery) return;
+                    lastQuery = query;
+                    
+                    for (const item of searchIndex) {
+                        const hide = !item.name.includes(query);
+                        if (item.el.hidden !== hide) {
+                            item.el.hidden = hide;
+                        }
+                    }
+                });
+            });
+        }
     </script>
 </body>
 </html>'''
+
+
+def _iter_report_functions(processed_data):
+    """Yield (file_data, func) pairs in report order."""
+    for file_data in processed_data:
+        for func in file_data['functions']:
+            yield file_data, func
+
+
+def _write_json_array(f, entries):
+    """Stream entries to binary file f as a JSON array that is safe to embed in a <script> block."""
+    f.write(b'[')
+    separator = b''
+    for entry in entries:
+        # Escape '</' so source containing </script> cannot end the script block
+        f.write(separator)
+        f.write(_json_dumps(entry).replace(b'</', b'<\\/'))
+        separator = b','
+    f.write(b']')
+
+
+def _write_html_report(f, processed_data):
+    """Stream the interactive HTML report for processed_data into the binary file object f."""
+    f.write(_HTML_REPORT_HEAD.encode('utf-8'))
+    f.write(load_report_css().encode('utf-8'))
+    f.write(_HTML_REPORT_HEADER.encode('utf-8'))
+    f.write(datetime.now().strftime("%B %d, %Y at %I:%M %p").encode('utf-8'))
+    f.write(_HTML_REPORT_BODY.encode('utf-8'))
+    
+    # Details payload, indexed by position in functionsData
+    _write_json_array(f, (
+        {
+            'params': func['params'],
+            'docstring': func['docstring'],
+            'usage_example': func['usage_example'],
+            'source_code': func['source_code']
+        }
+        for file_data, func in _iter_report_functions(processed_data)
+    ))
+    f.write(_HTML_REPORT_SCRIPT.encode('utf-8'))
+    
+    # Function index for JavaScript
+    _write_json_array(f, (
+        {
+            'id': func_id,
+            'file': file_data['file_name'],
+            'file_path': file_data['file_path'],
+            'language': file_data['language'],
+            'name': func['name'],
+            'type': func['type']
+        }
+        for func_id, (file_data, func) in enumerate(_iter_report_functions(processed_data))
+    ))
+    
+    f.write(_HTML_REPORT_TAIL.encode('utf-8'))
+
+
+def generate_html_report(processed_data, output_file='function_report.html'):
+    """
+    Generate an interactive HTML report with split-screen layout.
+    
+    The report is streamed piece by piece, with function data written one
+    entry at a time, so the full document is never assembled as a string. Both
+    the light index (name, file, language, type) and the details (params, docs,
+    source) are embedded as JSON blocks; the details are only parsed on first click.
+    
+    Args:
+        processed_data (list): Output from process_files() function
+        output_file (str or file object): Output HTML file name, or a binary
+            file object (e.g. io.BytesIO) to write the report into
     
-    # Write to file
+    Returns:
+        str or file object: Path to the generated HTML file, or output_file itself
+    """
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        if hasattr(output_file, 'write'):
+            _write_html_report(output_file, processed_data)
+            return output_file
+        
+        # Written in binary so orjson output goes to disk without a decode/encode
+        # round trip; a 1 MiB buffer batches the many small per-entry writes
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            _write_html_report(f, processed_data)
         print(f"HTML report generated: {output_file}")
         return output_file
     except Exception as e:
@@ -1441,6 +604,10 @@ def generate_html_report(processed_data, output_file='function_report.html'):
         return None
 
 
+# Files larger than this are skipped by process_files
+_MAX_FILE_BYTES = 2 * 1024 * 1024
+
+
 def process_files(file_paths_or_data, language=None):
     """
     Process multiple files and extract structured metadata for all functions.
@@ -1452,7 +619,8 @@ def process_files(file_paths_or_data, language=None):
     Returns:
         list: List of file metadata objects containing function details
     """
-    processed_data = []
+    # Collect (file_path, language) pairs to read
+    targets = []
     
     # Handle dict input from ingest_codebase
     if isinstance(file_paths_or_data, dict):
@@ -1460,113 +628,57 @@ def process_files(file_paths_or_data, language=None):
             if lang == 'summary':
                 continue
             
-            files = lang_data.get('files', [])
-            for file_path in files:
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        source_code = f.read()
-                    
-                    # Extract function metadata (at least 5 per file)
-                    functions = extract_function_metadata(source_code, lang, limit=5)
-                    
-                    if functions:
-                        processed_data.append({
-                            'file_path': file_path,
-                            'file_name': os.path.basename(file_path),
-                            'language': lang,
-                            'function_count': len(functions),
-                            'functions': functions
-                        })
-                
-                except Exception as e:
-                    print(f"Error processing {file_path}: {str(e)}")
+            for file_path in lang_data.get('files', []):
+                targets.append((file_path, lang))
     
     # Handle list of file paths
     elif isinstance(file_paths_or_data, list):
         for file_path in file_paths_or_data:
-            try:
-                # Determine language from extension
-                ext = os.path.splitext(file_path)[1].lower()
-                lang_map = {'.py': 'python', '.js': 'javascript', '.java': 'java', '.sql': 'sql'}
-                file_lang = language or lang_map.get(ext, 'unknown')
-                
-                if file_lang == 'unknown':
-                    continue
-                
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    source_code = f.read()
-                
-                # Extract function metadata (at least 5 per file)
-                functions = extract_function_metadata(source_code, file_lang, limit=5)
-                
-                if functions:
-                    processed_data.append({
-                        'file_path': file_path,
-                        'file_name': os.path.basename(file_path),
-                        'language': file_lang,
-                        'function_count': len(functions),
-                        'functions': functions
-                    })
+            # Determine language from extension
+            ext = os.path.splitext(file_path)[1].lower()
+            file_lang = language or EXTENSIONS.get(ext, 'unknown')
             
-            except Exception as e:
-                print(f"Error processing {file_path}: {str(e)}")
+            if file_lang != 'unknown':
+                targets.append((file_path, file_lang))
     
-    return processed_data
-
-
-def extract_python_docs(source_code):
-    """Extract documentation from Python source code using AST parsing with enhanced fallbacks."""
-    entities = []
+    # Read every file first so extraction can run across processes
+    file_paths, languages, sources = [], [], []
+    for file_path, lang in targets:
+        try:
+            # Skip oversized (typically minified or vendored) files without reading them
+            file_size = os.stat(file_path).st_size
+            if file_size > _MAX_FILE_BYTES:
+                print(f"Skipping {file_path}: {file_size} bytes exceeds the {_MAX_FILE_BYTES} byte limit")
+                continue
+            
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                sources.append(f.read())
+            file_paths.append(file_path)
+            languages.append(lang)
+        except Exception as e:
+            print(f"Error processing {file_path}: {str(e)}")
     
-    try:
-        tree = ast.parse(source_code)
-        lines = source_code.split('\n')
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                func_name = node.name
-                args_list = [arg.arg for arg in node.args.args]
-                docstring = ast.get_docstring(node)
-                
-                # If no docstring, try to extract inline comments or generate basic docs
-                if docstring is None:
-                    # Try to find comments before the function
-                    if hasattr(node, 'lineno') and node.lineno > 1:
-                        comment_lines = []
-                        for i in range(max(0, node.lineno - 4), node.lineno - 1):
-                            if i < len(lines):
-                                line = lines[i].strip()
-                                if line.startswith('#'):
-                                    comment_lines.append(line[1:].strip())
-                        
-                        if comment_lines:
-                            docstring = ' '.join(comment_lines)
-                        else:
-                            # Generate basic documentation from function signature
-                            docstring = f"Function: {func_name}"
-                            if args_list:
-                                docstring += f"\nParameters: {', '.join(args_list)}"
-                            else:
-                                docstring += "\nNo parameters"
-                            
-                            # Try to infer purpose from function name
-                            name_parts = func_name.replace('_', ' ').replace('get', 'retrieves').replace('set', 'sets').replace('calculate', 'calculates').replace('create', 'creates').replace('update', 'updates').replace('delete', 'deletes')
-                            docstring += f"\nInferred purpose: {name_parts}"
-                    else:
-                        # Fallback: basic signature info
-                        docstring = f"Function with {len(args_list)} parameter(s)"
-                        if args_list:
-                            docstring += f": {', '.join(args_list)}"
-                
-                entity = {
-                    "Name": func_name,
-                    "Type": "Function",
-                    "Params": args_list,
-                    "Docs": docstring
-                }
-                
-                entities.append(entity)
-                
+    # Extract function metadata (at least 5 per file)
+    results = extract_function_metadata_batch(sources, languages, limit=5)
+    
+    processed_data = []
+    for file_path, lang, functions in zip(file_paths, languages, results):
+        if functions:
+            processed_data.append({
+                'file_path': file_path,
+                'file_name': os.path.basename(file_path),
+                'language': lang,
+                'function_count': len(functions),
+                'functions': functions
+            })
+    
+    return processed_data
+
+
+def extract_python_docs(source_code):
+    """Extract documentation from Python source code using AST parsing with enhanced fallbacks."""
+    try:
+        return parse_python_docs(source_code)
     except IndentationError as e:
         st.error(f"IndentationError: {str(e)}")
         return []
@@ -1576,246 +688,293 @@ def extract_python_docs(source_code):
     except Exception as e:
         st.error(f"Error parsing Python code: {str(e)}")
         return []
-    
-    return entities
 
 
 def extract_js_docs(source_code):
     """Extract documentation from JavaScript source code with JSDoc and comment support."""
-    entities = []
-    lines = source_code.split('\n')
-    
     try:
-        # Pattern to find JSDoc comments
-        jsdoc_pattern = r'/\*\*(.*?)\*/'
-        
-        # Traditional function pattern
-        traditional_pattern = r'function\s+(\w+)\s*\((.*?)\)'
-        traditional_matches = re.finditer(traditional_pattern, source_code)
-        
-        for match in traditional_matches:
-            func_name = match.group(1)
-            params_str = match.group(2)
-            params_list = [p.strip() for p in params_str.split(',') if p.strip()]
-            
-            # Try to find JSDoc or comments before the function
-            func_start = match.start()
-            before_func = source_code[:func_start]
-            
-            # Look for JSDoc comment
-            jsdoc_matches = list(re.finditer(jsdoc_pattern, before_func, re.DOTALL))
-            if jsdoc_matches:
-                # Get the last JSDoc comment before the function
-                last_jsdoc = jsdoc_matches[-1].group(1).strip()
-                # Clean up JSDoc formatting
-                docs = '\n'.join(line.strip().lstrip('*').strip() for line in last_jsdoc.split('\n'))
-            else:
-                # Look for inline comments
-                func_line = source_code[:func_start].count('\n')
-                comment_lines = []
-                for i in range(max(0, func_line - 3), func_line):
-                    if i < len(lines):
-                        line = lines[i].strip()
-                        if line.startswith('//'):
-                            comment_lines.append(line[2:].strip())
-                
-                if comment_lines:
-                    docs = ' '.join(comment_lines)
-                else:
-                    # Generate basic docs
-                    docs = f"Function: {func_name}"
-                    if params_list:
-                        docs += f"\nParameters: {', '.join(params_list)}"
-                    # Convert camelCase to readable text
-                    name_hint = re.sub(r'([A-Z])', r' \1', func_name).strip().lower()
-                    docs += f"\nInferred purpose: {name_hint}"
-            
-            entity = {
-                "Name": func_name,
-                "Type": "Function",
-                "Params": params_list,
-                "Docs": docs
-            }
-            entities.append(entity)
-        
-        # Arrow function pattern
-        arrow_pattern = r'const\s+(\w+)\s*=\s*\((.*?)\)\s*=>'
-        arrow_matches = re.finditer(arrow_pattern, source_code)
-        
-        for match in arrow_matches:
-            func_name = match.group(1)
-            params_str = match.group(2)
-            params_list = [p.strip() for p in params_str.split(',') if p.strip()]
-            
-            # Try to find comments before the arrow function
-            func_start = match.start()
-            before_func = source_code[:func_start]
-            
-            # Look for JSDoc comment
-            jsdoc_matches = list(re.finditer(jsdoc_pattern, before_func, re.DOTALL))
-            if jsdoc_matches:
-                last_jsdoc = jsdoc_matches[-1].group(1).strip()
-                docs = '\n'.join(line.strip().lstrip('*').strip() for line in last_jsdoc.split('\n'))
-            else:
-                # Look for inline comments
-                func_line = source_code[:func_start].count('\n')
-                comment_lines = []
-                for i in range(max(0, func_line - 3), func_line):
-                    if i < len(lines):
-                        line = lines[i].strip()
-                        if line.startswith('//'):
-                            comment_lines.append(line[2:].strip())
-                
-                if comment_lines:
-                    docs = ' '.join(comment_lines)
-                else:
-                    # Generate basic docs
-                    docs = f"Arrow function: {func_name}"
-                    if params_list:
-                        docs += f"\nParameters: {', '.join(params_list)}"
-            
-            entity = {
-                "Name": func_name,
-                "Type": "Function",
-                "Params": params_list,
-                "Docs": docs
-            }
-            entities.append(entity)
-            
+        return parse_js_docs(source_code)
     except Exception as e:
         st.error(f"Error parsing JavaScript code: {str(e)}")
         return []
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+def extract_uploaded_docs(file_name, source_code):
+    """
+    Extract documentation entities from an uploaded file, dispatching on its extension.
+    
+    Cached by file name and content, so re-uploading unchanged files skips parsing.
     
-    return entities
+    Args:
+        file_name (str): Uploaded file name, used to pick the parser
+        source_code (str): Decoded file contents
+    
+    Returns:
+        list: Extracted entity dictionaries (empty for unsupported extensions)
+    """
+    if file_name.endswith('.py'):
+        return extract_python_docs(source_code)
+    elif file_name.endswith('.js'):
+        return extract_js_docs(source_code)
+    elif file_name.endswith('.java'):
+        try:
+            return extract_java_docs(source_code)
+        except Exception as e:
+            st.error(f"Error parsing Java code: {str(e)}")
+            return []
+    elif file_name.endswith('.sql'):
+        try:
+            return extract_sql_docs(source_code)
+        except Exception as e:
+            st.error(f"Error parsing SQL code: {str(e)}")
+            return []
+    return []
+
+
+def _embedding_cache_path(model, source_file, texts):
+    """Return the .npy path for one source file's texts under the current model and backend."""
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{_EMBEDDING_MODEL}:{getattr(model, 'backend', 'torch')}:{source_file}\0".encode('utf-8', 'surrogatepass'))
+    for text in texts:
+        hasher.update(text.encode('utf-8', 'surrogatepass'))
+        hasher.update(b'\0')
+    return os.path.join(_EMBEDDING_CACHE_DIR, f"{hasher.hexdigest()}.npy")
 
 
-def ingest_codebase(path):
+def encode_cached(model, texts, source_files):
     """
-    Ingest an entire codebase from a directory path.
-    Recursively traverses directories, collects all code files, and extracts documentation.
+    Encode texts, reusing per-source-file embeddings saved by earlier runs.
+    
+    Texts are grouped by source file and each group is looked up on disk
+    (memory-mapped, so only the rows actually read are paged in). Only the
+    groups that miss go through the model, in a single encode call.
     
     Args:
-        path (str): Path to directory or single file
-        
+        model: Loaded SentenceTransformer
+        texts (list): Texts to encode
+        source_files (list): Source file of each text ('' when unknown)
+    
     Returns:
-        dict: Structured data grouped by language with extracted entities
-        {
-            'python': {'files': [...], 'entities': [...]},
-            'javascript': {'files': [...], 'entities': [...]},
-            'java': {'files': [...], 'entities': [...]},
-            'sql': {'files': [...], 'entities': [...]},
-            'summary': {'total_files': int, 'total_entities': int}
-        }
+        torch.Tensor: One unit-length FP16 row per text, on the model's device
     """
-    # Initialize result structure
-    result = {
-        'python': {'files': [], 'entities': []},
-        'javascript': {'files': [], 'entities': []},
-        'java': {'files': [], 'entities': []},
-        'sql': {'files': [], 'entities': []},
-        'summary': {'total_files': 0, 'total_entities': 0}
-    }
+    import torch
+    import numpy as np
     
-    # Directories and files to ignore
-    ignore_dirs = {
-        'node_modules', '__pycache__', '.git', '.svn', 'venv', 'env',
-        'dist', 'build', '.idea', '.vscode', 'target', 'bin', 'obj'
-    }
-    ignore_files = {'.DS_Store', 'Thumbs.db', '.gitignore', '.gitkeep'}
-    
-    # Supported file extensions
-    extensions = {
-        '.py': 'python',
-        '.js': 'javascript',
-        '.java': 'java',
-        '.sql': 'sql'
-    }
+    if os.environ.get('DOCGEN_NOCACHE'):
+        return encode_smart(model, texts).half()
     
-    def should_ignore(name):
-        """Check if file/directory should be ignored."""
-        return name in ignore_dirs or name in ignore_files or name.startswith('.')
+    groups = {}
+    for idx, source_file in enumerate(source_files):
+        groups.setdefault(source_file, []).append(idx)
     
-    def process_file(file_path, language):
-        """Process a single file and extract entities."""
+    rows = [None] * len(texts)
+    misses = []
+    for source_file, indices in groups.items():
+        cache_path = _embedding_cache_path(model, source_file, [texts[i] for i in indices])
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            cached = np.load(cache_path, mmap_mode='r')
+        except (OSError, ValueError):
+            misses.append((cache_path, indices))
+            continue
+        if cached.shape[0] != len(indices):
+            misses.append((cache_path, indices))
+            continue
+        for row, idx in enumerate(indices):
+            rows[idx] = cached[row]
+    
+    if misses:
+        miss_indices = [idx for _, indices in misses for idx in indices]
+        encoded = encode_smart(model, [texts[i] for i in miss_indices]).half().cpu().numpy()
+        
+        start = 0
+        for cache_path, indices in misses:
+            group_rows = encoded[start:start + len(indices)]
+            start += len(indices)
+            for row, idx in enumerate(indices):
+                rows[idx] = group_rows[row]
             
-            # Extract entities based on language
-            entities = []
-            if language == 'python':
-                entities = extract_python_docs(content)
-            elif language == 'javascript':
-                entities = extract_js_docs(content)
-            elif language == 'java':
-                entities = extract_java_docs(content)
-            elif language == 'sql':
-                entities = extract_sql_docs(content)
+            # Write through a temp file and rename so readers never see a partial array
+            try:
+                os.makedirs(_EMBEDDING_CACHE_DIR, exist_ok=True)
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp.npy"
+                np.save(tmp_path, group_rows)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f"Error writing embedding cache: {str(e)}")
+    
+    return torch.from_numpy(np.stack(rows).astype(np.float16, copy=False)).to(model.device)
+
+
+def _entity_texts_key(entity_texts):
+    """Return a content hash identifying a list of entity texts."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for text in entity_texts:
+        hasher.update(text.encode('utf-8', 'surrogatepass'))
+        hasher.update(b'\0')
+    return hasher.hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def ingest_codebase_cached(folder_path, fingerprint):
+    """
+    Ingest a codebase, reusing the previous result while its files are unchanged.
+    
+    Args:
+        folder_path (str): Directory to analyze
+        fingerprint (str): codebase_fingerprint(folder_path); only used as part of the cache key
+    
+    Returns:
+        dict: ingest_codebase output for folder_path
+    """
+    return ingest_codebase(folder_path)
+
+
+def _report_function(entity):
+    """Map an extracted entity onto the function dict used by the HTML report, filling in defaults."""
+    name = entity.get('Name', 'Unknown')
+    return {
+        'name': name,
+        'params': entity.get('Params', []),
+        'docstring': entity.get('Docs', 'No documentation found'),
+        'usage_example': entity.get('Usage', f"{name}()"),
+        'source_code': entity.get('Source', '# Source code not available'),
+        'type': entity.get('Type', 'function')
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def build_report_data(data_key, _codebase_data, _entities):
+    """
+    Convert the analyzed entities into the processed_data list generate_html_report expects.
+    
+    Cached by data_key, a content hash of both inputs, so clicking the report
+    button again without re-analyzing reuses the previous structure.
+    
+    Args:
+        data_key (str): Hash identifying _codebase_data and _entities
+        _codebase_data (dict): ingest_codebase output (folder mode), or None
+        _entities (list): Extracted entities (file mode)
+    
+    Returns:
+        list: Per-file dicts with file_name, file_path, language and functions
+    """
+    codebase_data, entities = _codebase_data, _entities
+    processed_data = []
+    
+    if codebase_data:
+        # Folder mode: process all languages
+        for lang, lang_data in codebase_data.items():
+            entities = lang_data.get('entities', [])
             
-            # Add file info to each entity
+            # Group by file
+            files_dict = defaultdict(list)
             for entity in entities:
-                entity['source_file'] = file_path
+                files_dict[entity.get('source_file', 'Unknown')].append(entity)
             
-            return entities
-        except Exception as e:
-            print(f"Error processing {file_path}: {str(e)}")
-            return []
-    
-    def traverse_directory(dir_path):
-        """Recursively traverse directory and collect code files."""
-        try:
-            for entry in os.listdir(dir_path):
-                # Skip ignored items
-                if should_ignore(entry):
-                    continue
+            # Convert to HTML report format
+            for file_path, file_entities in files_dict.items():
+                file_name = os.path.basename(file_path)
+                functions_list = [_report_function(entity) for entity in file_entities]
                 
-                full_path = os.path.join(dir_path, entry)
-                
-                # If directory, recurse
-                if os.path.isdir(full_path):
-                    traverse_directory(full_path)
-                
-                # If file, check extension and process
-                elif os.path.isfile(full_path):
-                    _, ext = os.path.splitext(entry)
-                    if ext in extensions:
-                        language = extensions[ext]
-                        
-                        # Add file to list
-                        result[language]['files'].append(full_path)
-                        result['summary']['total_files'] += 1
-                        
-                        # Extract entities
-                        entities = process_file(full_path, language)
-                        result[language]['entities'].extend(entities)
-                        result['summary']['total_entities'] += len(entities)
-        
-        except PermissionError:
-            print(f"Permission denied: {dir_path}")
-        except Exception as e:
-            print(f"Error traversing {dir_path}: {str(e)}")
-    
-    # Check if path is file or directory
-    if os.path.isfile(path):
-        # Single file
-        _, ext = os.path.splitext(path)
-        if ext in extensions:
-            language = extensions[ext]
-            result[language]['files'].append(path)
-            result['summary']['total_files'] = 1
+                processed_data.append({
+                    'file_name': file_name,
+                    'file_path': file_path,
+                    'language': lang,
+                    'functions': functions_list
+                })
+    else:
+        # File mode: single file
+        if entities:
+            lang = 'python'  # Default
+            functions_list = [_report_function(entity) for entity in entities]
             
-            entities = process_file(path, language)
-            result[language]['entities'].extend(entities)
-            result['summary']['total_entities'] = len(entities)
+            processed_data.append({
+                'file_name': 'uploaded_file',
+                'file_path': 'uploaded_file',
+                'language': lang,
+                'functions': functions_list
+            })
+    
+    return processed_data
+
+
+def get_entity_embeddings(model, entity_texts, source_files=None, key=None):
+    """
+    Return embeddings for entity_texts, reusing the tensor from earlier queries.
     
-    elif os.path.isdir(path):
-        # Directory - traverse recursively
-        traverse_directory(path)
+    The tensor is kept in session_state keyed by a hash of the texts, so repeat
+    searches over the same entities only encode the query. On CUDA it is kept in
+    FP16, halving its memory; unit-length vectors lose nothing meaningful there.
+    CPU half-precision matmul is slow (or missing on some torch builds), so on
+    CPU the FP16 rows are upcast to FP32 once here and that copy is cached.
+    A new session falls back to encode_cached's on-disk store before the model.
     
-    else:
-        raise ValueError(f"Invalid path: {path}")
+    Args:
+        model: Loaded SentenceTransformer
+        entity_texts (list): Combined name/docs text per entity
+        source_files (list, optional): Source file of each entity, used to shard the disk cache
+        key (str, optional): Precomputed _entity_texts_key(entity_texts)
     
-    return result
+    Returns:
+        torch.Tensor: One unit-length embedding row per entity, on the model's device
+            (FP16 on CUDA, FP32 otherwise)
+    """
+    if key is None:
+        key = _entity_texts_key(entity_texts)
+    
+    if st.session_state.get('entity_emb_key') != key:
+        # Encode each distinct text once, then gather rows back into entity order
+        unique_texts = {}
+        positions = [unique_texts.setdefault(text, len(unique_texts)) for text in entity_texts]
+        if source_files is None:
+            source_files = [''] * len(entity_texts)
+        unique_files = [''] * len(unique_texts)
+        for position, source_file in zip(positions, source_files):
+            if not unique_files[position]:
+                unique_files[position] = source_file
+        
+        embeddings = encode_cached(model, list(unique_texts), unique_files)
+        if len(unique_texts) < len(entity_texts):
+            import torch
+            embeddings = embeddings[torch.tensor(positions, device=embeddings.device)]
+        if embeddings.device.type != 'cuda':
+            embeddings = embeddings.float()
+        
+        st.session_state.entity_emb_tensor = embeddings
+        st.session_state.entity_emb_key = key
+    
+    return st.session_state.entity_emb_tensor
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _search_top_match(query, entities_key, _entity_texts, _source_files):
+    """
+    Find the entity text closest to query, cached per (query, entities_key).
+    
+    Repeating a query over the same entities skips the query encode and scoring.
+    The underscore-prefixed arguments are not hashed; entities_key stands in for them.
+    
+    Args:
+        query (str): Search query
+        entities_key (str): _entity_texts_key of _entity_texts
+        _entity_texts (list): Combined name/docs text per entity
+        _source_files (list): Source file of each entity
+    
+    Returns:
+        tuple: (index of the best match, its cosine similarity)
+    """
+    model = load_model()
+    query_embedding = model.encode(query, convert_to_tensor=True, normalize_embeddings=True)
+    entity_embeddings = get_entity_embeddings(model, _entity_texts, _source_files, entities_key)
+    
+    # Both sides are unit length, so one matrix-vector product gives cosine similarity.
+    # The query is cast to the cached matrix's dtype (FP16 on CUDA, FP32 on CPU) so the
+    # matrix is never copied per query; only the N scores are upcast
+    similarities = (entity_embeddings @ query_embedding.to(entity_embeddings.dtype)).float()
+    
+    top_idx = similarities.argmax().item()
+    return top_idx, similarities[top_idx].item()
 
 
 def perform_search(query, entities):
@@ -1839,13 +998,8 @@ def perform_search(query, entities):
             combined_text = f"{entity['Name']} {entity['Docs']}"
             entity_texts.append(combined_text)
         
-        query_embedding = model.encode(query, convert_to_tensor=True)
-        entity_embeddings = model.encode(entity_texts, convert_to_tensor=True)
-        
-        similarities = util.cos_sim(query_embedding, entity_embeddings)[0]
-        
-        top_idx = similarities.argmax().item()
-        top_score = similarities[top_idx].item()
+        source_files = [entity.get('source_file', '') for entity in entities]
+        top_idx, top_score = _search_top_match(query, _entity_texts_key(entity_texts), entity_texts, source_files)
         
         top_entity = entities[top_idx].copy()
         top_entity['similarity_score'] = top_score
@@ -1859,32 +1013,142 @@ def perform_search(query, entities):
 
 def generate_markdown(entities):
     """Generate markdown documentation from entities."""
-    markdown_content = "# Function Documentation\n\n"
+    # One chunk per entity, joined once at the end instead of growing a string
+    parts = ["# Function Documentation\n\n"]
     
     for entity in entities:
-        markdown_content += f"## {entity['Name']}\n\n"
-        markdown_content += f"**Type:** {entity['Type']}\n\n"
-        
-        if entity['Params']:
-            markdown_content += f"**Parameters:** {', '.join(entity['Params'])}\n\n"
-        else:
-            markdown_content += "**Parameters:** None\n\n"
-        
-        markdown_content += f"**Documentation:**\n\n{entity['Docs']}\n\n"
-        markdown_content += "---\n\n"
+        params = ', '.join(entity['Params']) if entity['Params'] else "None"
+        parts.append(
+            f"## {entity['Name']}\n\n"
+            f"**Type:** {entity['Type']}\n\n"
+            f"**Parameters:** {params}\n\n"
+            f"**Documentation:**\n\n{entity['Docs']}\n\n"
+            "---\n\n"
+        )
     
-    return markdown_content
+    return ''.join(parts)
 
 
 def generate_csv(entities):
     """Generate CSV from entities."""
+    import pandas as pd
+    
     df = pd.DataFrame(entities)
-    df['Params'] = df['Params'].apply(lambda x: ', '.join(x) if x else 'None')
+    # A plain comprehension skips the per-row Series.apply dispatch
+    df['Params'] = [', '.join(params) if params else 'None' for params in df['Params']]
     csv_content = df.to_csv(index=False)
     
     return csv_content
 
 
+def export_csv(entities, exclude=('source_file',)):
+    """
+    Write entities straight to CSV bytes, without building a DataFrame.
+    
+    Columns follow the order keys first appear in, like pd.DataFrame(entities),
+    and list values are written as their repr, matching DataFrame.to_csv.
+    
+    Args:
+        entities (list): Entity dicts to export
+        exclude (tuple): Keys left out of the CSV
+    
+    Returns:
+        bytes: UTF-8 encoded CSV with a header row
+    """
+    fieldnames = [key for key in dict.fromkeys(key for entity in entities for key in entity) if key not in exclude]
+    
+    buffer = io.BytesIO()
+    text = io.TextIOWrapper(buffer, encoding='utf-8', newline='')
+    writer = csv.DictWriter(text, fieldnames=fieldnames, extrasaction='ignore', lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(entities)
+    # Flush and detach rather than close, which would also close the buffer
+    text.flush()
+    text.detach()
+    
+    return buffer.getvalue()
+
+
+def export_parquet(entities, exclude=('source_file',)):
+    """
+    Write entities to ZSTD-compressed Parquet bytes.
+    
+    Params stay a list column instead of a string, and the low-cardinality
+    columns (such as Type) are dictionary encoded by the writer.
+    
+    Args:
+        entities (list): Entity dicts to export
+        exclude (tuple): Keys left out of the file
+    
+    Returns:
+        bytes: Parquet file contents
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    # Columns are the union of keys (from_pylist would only use the first row's)
+    fieldnames = [key for key in dict.fromkeys(key for entity in entities for key in entity) if key not in exclude]
+    table = pa.table({key: [entity.get(key) for entity in entities] for key in fieldnames})
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, compression='zstd')
+    
+    return buffer.getvalue()
+
+
+def entity_details_html(entities, color):
+    """
+    Render the detail cards for one file's entities as a single HTML string.
+    
+    Emitting one markdown block per file instead of several elements per entity
+    keeps large folders to a handful of Streamlit messages.
+    
+    Args:
+        entities (list): Entity dicts from one source file
+        color (str): Accent color of the entities' language
+    
+    Returns:
+        str: HTML for all cards, with every entity field escaped
+    """
+    cards = []
+    for idx, entity in enumerate(entities, 1):
+        params = entity.get('Params', [])
+        params_html = ''
+        if params:
+            params_html = f"<br><small>{html.escape(', '.join(params[:5]))}{', ...' if len(params) > 5 else ''}</small>"
+        # Newlines become <br> so a blank line in the docs cannot end the HTML block early
+        docs = html.escape(entity.get('Docs', 'No documentation found')).replace('\n', '<br>')
+        cards.append(
+            f'<div class="entity-detail" style="border-left-color: {color};">'
+            f'<h5>{idx}. {html.escape(entity.get("Name", "Unknown"))}'
+            f'<span class="entity-type-badge" style="background: {color};">{html.escape(entity.get("Type", "Unknown"))}</span></h5>'
+            f'<div class="entity-detail-body">'
+            f'<div><strong>Parameters:</strong> {len(params)}{params_html}</div>'
+            f'<div><strong>Documentation:</strong><div class="entity-docs">{docs}</div></div>'
+            f'</div></div>'
+        )
+    return ''.join(cards)
+
+
+def summarize_entities(entities):
+    """
+    Count entities per type and how many carry real documentation, in one pass.
+    
+    Args:
+        entities (list): Extracted entity dicts
+    
+    Returns:
+        tuple: (dict of type -> count, number of documented entities)
+    """
+    types_count = {}
+    documented = 0
+    for entity in entities:
+        entity_type = entity['Type']
+        types_count[entity_type] = types_count.get(entity_type, 0) + 1
+        if entity['Docs'] != "No documentation found":
+            documented += 1
+    return types_count, documented
+
+
 def calculate_time_saved(entities):
     """
     Calculate estimated time saved by using Lumos instead of manually reading code.
@@ -1910,10 +1174,9 @@ def calculate_time_saved(entities):
         'Unknown': 8     # minutes - conservative estimate
     }
     
-    total_minutes = 0
-    for entity in entities:
-        entity_type = entity.get('Type', 'Unknown')
-        total_minutes += time_per_entity.get(entity_type, 8)
+    # Count per type first so the weighting is one multiply per distinct type
+    type_counts = Counter(entity.get('Type', 'Unknown') for entity in entities)
+    total_minutes = sum(time_per_entity.get(entity_type, 8) * count for entity_type, count in type_counts.items())
     
     hours = int(total_minutes // 60)
     minutes = int(total_minutes % 60)
@@ -1924,16 +1187,23 @@ def calculate_time_saved(entities):
         return total_minutes, 0, f"{minutes} minutes"
 
 
-def generate_pdf(entities):
-    """Generate a well-structured PDF document from entities."""
-    if not REPORTLAB_AVAILABLE:
-        return None
+# Paragraph markup escapes, applied to documentation text in a single pass
+_PDF_MARKUP_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+
+@lru_cache(maxsize=1)
+def _pdf_styles():
+    """
+    Build the PDF paragraph and table styles once; every generate_pdf call reuses them.
     
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.75*inch, bottomMargin=0.75*inch)
-    story = []
+    Returns:
+        dict: Styles keyed by role ('title', 'heading', ..., 'details_table')
+    """
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
     
-    # Define custom styles
     styles = getSampleStyleSheet()
     
     # Title style
@@ -1990,6 +1260,82 @@ def generate_pdf(entities):
         fontName='Courier'
     )
     
+    # Footer style
+    footer_style = ParagraphStyle(
+        'Footer',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=colors.HexColor('#8B7B9B'),
+        alignment=TA_CENTER
+    )
+    
+    summary_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E8D5FF')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#6B5B7B')),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 11),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#FEFBFF')),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E8B4F0')),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F0FF')])
+    ])
+    
+    details_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#FFE5F1')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#6B5B7B')),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E8B4F0')),
+    ])
+    
+    return {
+        'title': title_style,
+        'heading': heading_style,
+        'subheading': subheading_style,
+        'body': body_style,
+        'code': code_style,
+        'footer': footer_style,
+        'summary_table': summary_table_style,
+        'details_table': details_table_style
+    }
+
+
+def generate_pdf(entities, overview=None):
+    """
+    Generate a well-structured PDF document from entities.
+    
+    Args:
+        entities (list): Extracted entity dicts
+        overview (tuple, optional): summarize_entities() result, if already computed
+    
+    Returns:
+        bytes: The PDF document, or None if reportlab is unavailable
+    """
+    if not REPORTLAB_AVAILABLE:
+        return None
+    
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, HRFlowable
+    from reportlab.lib import colors
+    
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.75*inch, bottomMargin=0.75*inch)
+    story = []
+    
+    # Custom styles, built once per process
+    pdf_styles = _pdf_styles()
+    title_style = pdf_styles['title']
+    heading_style = pdf_styles['heading']
+    subheading_style = pdf_styles['subheading']
+    body_style = pdf_styles['body']
+    footer_style = pdf_styles['footer']
+    
     # Add title
     story.append(Paragraph("📚 Code Documentation", title_style))
     story.append(Spacer(1, 0.2*inch))
@@ -2003,12 +1349,7 @@ def generate_pdf(entities):
     story.append(Paragraph("📊 Documentation Summary", heading_style))
     
     # Create summary table
-    types_count = {}
-    for entity in entities:
-        entity_type = entity['Type']
-        types_count[entity_type] = types_count.get(entity_type, 0) + 1
-    
-    documented = sum(1 for e in entities if e['Docs'] != "No documentation found")
+    types_count, documented = overview or summarize_entities(entities)
     
     summary_data = [
         ['Metric', 'Value'],
@@ -2021,17 +1362,7 @@ def generate_pdf(entities):
         summary_data.append([f'{entity_type}s', str(count)])
     
     summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E8D5FF')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#6B5B7B')),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#FEFBFF')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E8B4F0')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F0FF')])
-    ]))
+    summary_table.setStyle(pdf_styles['summary_table'])
     
     story.append(summary_table)
     story.append(Spacer(1, 0.4*inch))
@@ -2046,6 +1377,7 @@ def generate_pdf(entities):
         entities_by_type[entity_type].append(entity)
     
     # Add detailed documentation for each type
+    last_type = list(entities_by_type.keys())[-1] if entities_by_type else None
     for entity_type, type_entities in sorted(entities_by_type.items()):
         # Type header
         story.append(Paragraph(f"📑 {entity_type}s ({len(type_entities)})", heading_style))
@@ -2073,17 +1405,7 @@ def generate_pdf(entities):
                 details_data.append(['Parameters', 'None'])
             
             details_table = Table(details_data, colWidths=[1.5*inch, 4.5*inch])
-            details_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#FFE5F1')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#6B5B7B')),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E8B4F0')),
-            ]))
+            details_table.setStyle(pdf_styles['details_table'])
             
             story.append(details_table)
             story.append(Spacer(1, 0.1*inch))
@@ -2093,35 +1415,27 @@ def generate_pdf(entities):
             story.append(Paragraph("<b>Documentation:</b>", body_style))
             
             # Clean and format documentation text
-            docs_clean = docs.replace('<', '<').replace('>', '>')
-            # Split long documentation into paragraphs
-            doc_paragraphs = docs_clean.split('\n')
-            for para in doc_paragraphs:
-                if para.strip():
-                    story.append(Paragraph(para.strip(), body_style))
+            docs_clean = docs.translate(_PDF_MARKUP_ESCAPE)
+            # Keep the documentation's lines in one Paragraph rather than one flowable per line
+            doc_lines = [line.strip() for line in docs_clean.split('\n') if line.strip()]
+            if doc_lines:
+                story.append(Paragraph('<br/>'.join(doc_lines), body_style))
             
             story.append(Spacer(1, 0.2*inch))
             
             # Add separator between entities
             if i < len(type_entities):
-                story.append(Paragraph("─" * 80, body_style))
+                story.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#E8B4F0')))
                 story.append(Spacer(1, 0.1*inch))
         
         # Page break between types
-        if entity_type != list(entities_by_type.keys())[-1]:
+        if entity_type != last_type:
             story.append(PageBreak())
     
     # Add footer
     story.append(PageBreak())
     story.append(Spacer(1, 2*inch))
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.HexColor('#8B7B9B'),
-        alignment=TA_CENTER
-    )
-    story.append(Paragraph("─" * 80, footer_style))
+    story.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#8B7B9B')))
     story.append(Spacer(1, 0.2*inch))
     story.append(Paragraph("Generated by Lumos Doc Gen ✨", footer_style))
     story.append(Paragraph(f"<i>Total: {len(entities)} entities documented</i>", footer_style))
@@ -2173,7 +1487,7 @@ with col2:
         if folder_path and st.button("Analyze Folder", type="primary"):
             if os.path.exists(folder_path) and os.path.isdir(folder_path):
                 with st.spinner('✨ Analyzing codebase...'):
-                    st.session_state.codebase_data = ingest_codebase(folder_path)
+                    st.session_state.codebase_data = ingest_codebase_cached(folder_path, codebase_fingerprint(folder_path))
                     st.session_state.view = 'results'
                     st.rerun()
             else:
@@ -2209,19 +1523,8 @@ if uploaded_files and (not st.session_state.entities or st.session_state.view ==
         
         for uploaded_file in uploaded_files:
             file_content = uploaded_file.read().decode('utf-8')
-            
-            if uploaded_file.name.endswith('.py'):
-                extracted_entities = extract_python_docs(file_content)
-                st.session_state.entities.extend(extracted_entities)
-            elif uploaded_file.name.endswith('.js'):
-                extracted_entities = extract_js_docs(file_content)
-                st.session_state.entities.extend(extracted_entities)
-            elif uploaded_file.name.endswith('.java'):
-                extracted_entities = extract_java_docs(file_content)
-                st.session_state.entities.extend(extracted_entities)
-            elif uploaded_file.name.endswith('.sql'):
-                extracted_entities = extract_sql_docs(file_content)
-                st.session_state.entities.extend(extracted_entities)
+            extracted_entities = extract_uploaded_docs(uploaded_file.name, file_content)
+            st.session_state.entities.extend(extracted_entities)
         
         if st.session_state.entities:
             st.session_state.view = 'results'
@@ -2230,6 +1533,8 @@ if uploaded_files and (not st.session_state.entities or st.session_state.view ==
 
 # VIEW 2: RESULTS PAGE
 if st.session_state.view == 'results' and (st.session_state.entities or st.session_state.codebase_data):
+    import pandas as pd
+    
     # Determine which data to display
     if st.session_state.codebase_data:
         # Folder mode - use codebase data
@@ -2242,6 +1547,9 @@ if st.session_state.view == 'results' and (st.session_state.entities or st.sessi
         # File mode - use entities
         display_entities = st.session_state.entities
     
+    # Type counts and documented total, shared by the metrics row and the PDF export
+    overview = summarize_entities(display_entities)
+    
     # Time Saved Metric at the very top
     total_minutes, hours, time_str = calculate_time_saved(display_entities)
     
@@ -2379,10 +1687,7 @@ if st.session_state.view == 'results' and (st.session_state.entities or st.sessi
     st.markdown("### Documentation Overview")
     col1, col2, col3 = st.columns(3)
     
-    types_count = {}
-    for entity in display_entities:
-        entity_type = entity['Type']
-        types_count[entity_type] = types_count.get(entity_type, 0) + 1
+    types_count, documented = overview
     
     with col1:
         st.metric("Total Entities", len(display_entities))
@@ -2391,7 +1696,6 @@ if st.session_state.view == 'results' and (st.session_state.entities or st.sessi
         st.metric("Unique Types", len(types_count))
     
     with col3:
-        documented = sum(1 for e in display_entities if e['Docs'] != "No documentation found")
         st.metric("Documented", f"{documented}/{len(display_entities)}")
     
     st.markdown("<br>", unsafe_allow_html=True)
@@ -2434,12 +1738,9 @@ if st.session_state.view == 'results' and (st.session_state.entities or st.sessi
                 """, unsafe_allow_html=True)
                 
                 # Group entities by source file
-                files_dict = {}
+                files_dict = defaultdict(list)
                 for entity in entities:
-                    source_file = entity.get('source_file', 'Unknown')
-                    if source_file not in files_dict:
-                        files_dict[source_file] = []
-                    files_dict[source_file].append(entity)
+                    files_dict[entity.get('source_file', 'Unknown')].append(entity)
                 
                 # Display each file's entities
                 for file_path, file_entities in sorted(files_dict.items()):
@@ -2448,57 +1749,19 @@ if st.session_state.view == 'results' and (st.session_state.entities or st.sessi
                     with st.expander(f"📄 **{file_name}** ({len(file_entities)} entities)", expanded=False):
                         st.markdown(f"<small style='color: #8B7B9B;'>Path: `{file_path}`</small>", unsafe_allow_html=True)
                         
-                        # Create DataFrame for this file
-                        file_df = pd.DataFrame(file_entities)
-                        
-                        # Remove source_file column if it exists
-                        if 'source_file' in file_df.columns:
-                            file_df = file_df.drop(columns=['source_file'])
+                        # Create DataFrame for this file, selecting every column but source_file
+                        # up front instead of building it and copying the frame to drop it
+                        columns = [key for key in dict.fromkeys(key for entity in file_entities for key in entity) if key != 'source_file']
+                        file_df = pd.DataFrame(file_entities, columns=columns)
                         
                         st.dataframe(file_df, use_container_width=True, height=min(300, len(file_entities) * 35 + 50))
                         
                         # Show detailed view for each entity
                         st.markdown("#### Entity Details")
-                        for idx, entity in enumerate(file_entities, 1):
-                            with st.container():
-                                st.markdown(f"""
-                                <div style="
-                                    background: #FEFBFF;
-                                    padding: 1rem;
-                                    border-radius: 10px;
-                                    margin: 0.5rem 0;
-                                    border-left: 3px solid {info['color']};
-                                ">
-                                    <h5 style="margin: 0 0 0.5rem 0; color: #6B5B7B;">
-                                        {idx}. {entity.get('Name', 'Unknown')}
-                                        <span style="
-                                            background: {info['color']};
-                                            padding: 0.2rem 0.5rem;
-                                            border-radius: 5px;
-                                            font-size: 0.75rem;
-                                            margin-left: 0.5rem;
-                                        ">{entity.get('Type', 'Unknown')}</span>
-                                    </h5>
-                                </div>
-                                """, unsafe_allow_html=True)
-                                
-                                col1, col2 = st.columns([1, 3])
-                                with col1:
-                                    params = entity.get('Params', [])
-                                    st.markdown(f"**Parameters:** {len(params)}")
-                                    if params:
-                                        st.markdown(f"<small>{', '.join(params[:5])}{', ...' if len(params) > 5 else ''}</small>", unsafe_allow_html=True)
-                                
-                                with col2:
-                                    st.markdown("**Documentation:**")
-                                    docs = entity.get('Docs', 'No documentation found')
-                                    st.info(docs)
-                                
-                                st.markdown("<hr style='margin: 0.5rem 0; border: none; border-top: 1px solid #E8E8E8;'>", unsafe_allow_html=True)
+                        st.markdown(entity_details_html(file_entities, info['color']), unsafe_allow_html=True)
     else:
         # FILE MODE: Show simple DataFrame
-        df = pd.DataFrame(display_entities)
-        st.dataframe(df, use_container_width=True, height=400)
+        st.dataframe(pd.DataFrame(display_entities), use_container_width=True, height=400)
 
     # Export Section
     st.markdown("---")
@@ -2506,35 +1769,38 @@ if st.session_state.view == 'results' and (st.session_state.entities or st.sessi
     
     col1, col2, col3, col4 = st.columns(4)
     
+    # Export data is passed as callables, so each file is only built when its button is clicked
     with col1:
-        markdown_content = generate_markdown(display_entities)
         st.download_button(
             label="📝 Markdown",
-            data=markdown_content,
+            data=lambda: generate_markdown(display_entities),
             file_name="documentation.md",
             mime="text/markdown",
             use_container_width=True
         )
     
     with col2:
-        csv_df = pd.DataFrame(display_entities)
-        if 'source_file' in csv_df.columns:
-            csv_df = csv_df.drop(columns=['source_file'])
-        csv_content = csv_df.to_csv(index=False)
         st.download_button(
             label="📊 CSV",
-            data=csv_content,
+            data=lambda: export_csv(display_entities),
             file_name="documentation.csv",
             mime="text/csv",
             use_container_width=True
         )
+        if PYARROW_AVAILABLE:
+            st.download_button(
+                label="🗃️ Parquet",
+                data=lambda: export_parquet(display_entities),
+                file_name="documentation.parquet",
+                mime="application/vnd.apache.parquet",
+                use_container_width=True
+            )
     
     with col3:
         if REPORTLAB_AVAILABLE:
-            pdf_buffer = generate_pdf(display_entities)
             st.download_button(
                 label="📄 PDF",
-                data=pdf_buffer,
+                data=lambda: generate_pdf(display_entities, overview),
                 file_name="documentation.pdf",
                 mime="application/pdf",
                 use_container_width=True
@@ -2551,86 +1817,33 @@ if st.session_state.view == 'results' and (st.session_state.entities or st.sessi
         if st.button("🌐 Interactive HTML", type="primary", use_container_width=True, help="Generate and open interactive HTML report"):
             with st.spinner("Generating HTML report..."):
                 # Prepare data for HTML report
-                processed_data = []
-                
-                if st.session_state.codebase_data:
-                    # Folder mode: process all languages
-                    for lang, lang_data in st.session_state.codebase_data.items():
-                        entities = lang_data.get('entities', [])
-                        
-                        # Group by file
-                        files_dict = {}
-                        for entity in entities:
-                            source_file = entity.get('source_file', 'Unknown')
-                            if source_file not in files_dict:
-                                files_dict[source_file] = []
-                            files_dict[source_file].append(entity)
-                        
-                        # Convert to HTML report format
-                        for file_path, file_entities in files_dict.items():
-                            file_name = os.path.basename(file_path)
-                            functions_list = []
-                            
-                            for entity in file_entities:
-                                functions_list.append({
-                                    'name': entity.get('Name', 'Unknown'),
-                                    'params': entity.get('Params', []),
-                                    'docstring': entity.get('Docs', 'No documentation found'),
-                                    'usage_example': entity.get('Usage', f"{entity.get('Name', 'Unknown')}()"),
-                                    'source_code': entity.get('Source', '# Source code not available'),
-                                    'type': entity.get('Type', 'function')
-                                })
-                            
-                            processed_data.append({
-                                'file_name': file_name,
-                                'file_path': file_path,
-                                'language': lang,
-                                'functions': functions_list
-                            })
-                else:
-                    # File mode: single file
-                    if st.session_state.entities:
-                        # Get language from first entity or default to python
-                        first_entity = st.session_state.entities[0]
-                        lang = 'python'  # Default
-                        
-                        functions_list = []
-                        for entity in st.session_state.entities:
-                            functions_list.append({
-                                'name': entity.get('Name', 'Unknown'),
-                                'params': entity.get('Params', []),
-                                'docstring': entity.get('Docs', 'No documentation found'),
-                                'usage_example': entity.get('Usage', f"{entity.get('Name', 'Unknown')}()"),
-                                'source_code': entity.get('Source', '# Source code not available'),
-                                'type': entity.get('Type', 'function')
-                            })
-                        
-                        processed_data.append({
-                            'file_name': 'uploaded_file',
-                            'file_path': 'uploaded_file',
-                            'language': lang,
-                            'functions': functions_list
-                        })
+                data_key = hashlib.blake2b(
+                    _json_dumps([st.session_state.codebase_data, st.session_state.entities]), digest_size=16
+                ).hexdigest()
+                processed_data = build_report_data(data_key, st.session_state.codebase_data, st.session_state.entities)
                 
                 # Generate HTML report
-                import datetime
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 html_filename = f"interactive_report_{timestamp}.html"
                 
                 try:
-                    output_file = generate_html_report(processed_data, html_filename)
-                    if output_file:
+                    # Render into memory once; the same bytes feed the saved file and the download
+                    report_buffer = generate_html_report(processed_data, io.BytesIO())
+                    if report_buffer:
+                        html_content = report_buffer.getvalue()
+                        with open(html_filename, 'wb') as f:
+                            f.write(html_content)
+                        output_file = html_filename
                         st.success(f"✅ HTML report generated: {html_filename}")
                         
-                        # Provide download button
-                        with open(output_file, 'r', encoding='utf-8') as f:
-                            html_content = f.read()
-                        
+                        # Provide download button; the report is mostly repeated markup, so the
+                        # gzipped download is several times smaller. Compressed eagerly: this button
+                        # only exists on the run where the report button was clicked
                         st.download_button(
-                            label="⬇️ Download HTML Report",
-                            data=html_content,
-                            file_name=html_filename,
-                            mime="text/html",
+                            label="⬇️ Download HTML Report (gzip)",
+                            data=gzip.compress(html_content, compresslevel=6),
+                            file_name=f"{html_filename}.gz",
+                            mime="application/gzip",
                             use_container_width=True
                         )
                         
@@ -2655,4 +1868,8 @@ if st.session_state.view == 'results' and (st.session_state.entities or st.sessi
     </div>
     """, unsafe_allow_html=True)
 
+# Warm the model cache once the page has rendered so the first search is a cache hit
+if SENTENCE_TRANSFORMERS_AVAILABLE:
+    load_model()
+
 # Made with Bob
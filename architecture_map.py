@@ -4,9 +4,17 @@ Generates UML-style diagrams showing project structure and dependencies using Gr
 """
 
 import os
+import sys
 import ast
 import re
+import json
+import mmap
+import contextlib
+import shutil
+import subprocess
+import tempfile
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 # Try to import graphviz, but make it optional
 try:
@@ -15,6 +23,89 @@ try:
 except ImportError:
     GRAPHVIZ_AVAILABLE = False
 
+# Patterns compiled once at import, shared by every file scanned. The regex-based
+# analyzers scan memory-mapped bytes, so their patterns are bytes patterns.
+# ES6 imports, require calls, function declarations and arrow functions in one alternation
+_JS_ALL_RE = re.compile(
+    rb'import\s+.*?\s+from\s+[\'"](?P<import>.+?)[\'"]'
+    rb'|require\([\'"](?P<require>.+?)[\'"]\)'
+    rb'|function\s+(?P<function>\w+)\s*\('
+    rb'|const\s+(?P<arrow>\w+)\s*=\s*\(.*?\)\s*=>'
+)
+_JAVA_IMPORT_RE = re.compile(rb'import\s+([\w.]+);')
+_JAVA_CLASS_RE = re.compile(rb'(?:public|private|protected)?\s*class\s+(\w+)')
+_JAVA_METHOD_RE = re.compile(rb'(?:public|private|protected)\s+(?:static\s+)?[\w\<\>\[\]]+\s+(\w+)\s*\(')
+# CREATE TABLE/PROCEDURE/FUNCTION/VIEW in one alternation; group names match analyze_sql_file's keys
+_SQL_ALL_RE = re.compile(
+    rb'CREATE\s+(?:TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?P<tables>\w+)'
+    rb'|(?:OR\s+REPLACE\s+)?(?:PROCEDURE\s+(?P<procedures>\w+)'
+    rb'|FUNCTION\s+(?P<functions>\w+)'
+    rb'|VIEW\s+(?P<views>\w+)))',
+    re.IGNORECASE
+)
+
+
+# Python files larger than this are not parsed; the AST is many times the source size
+_MAX_PARSE_BYTES = 2 * 1024 * 1024
+# Bytes checked for a NUL when deciding whether a file is binary
+_BINARY_SNIFF_BYTES = 4096
+
+
+def _dot_quote(value):
+    """Quote a DOT ID; backslash escapes such as the \\n line breaks in labels are kept."""
+    return '"' + str(value).replace('"', '\\"') + '"'
+
+
+def _dot_attrs(**attrs):
+    """Format keyword attributes as a space-separated DOT attribute list."""
+    return ' '.join(f"{key}={_dot_quote(value)}" for key, value in attrs.items())
+
+
+def _map_source(f):
+    """Memory-map an open binary file read-only; empty files, which mmap rejects, map to b''."""
+    if os.fstat(f.fileno()).st_size == 0:
+        return contextlib.nullcontext(b'')
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _decode_all(values):
+    """Decode matched byte strings to str."""
+    return [value.decode('utf-8', 'replace') for value in values]
+
+
+class _DefinitionCollector(ast.NodeVisitor):
+    """
+    Collect module-level imports, class names and function names in one traversal.
+    
+    Only statement blocks are entered (so imports under a top-level if/try are
+    still found); class and function bodies and expressions are never walked.
+    """
+    
+    def __init__(self, result):
+        self.result = result
+    
+    def generic_visit(self, node):
+        for field in ('body', 'orelse', 'finalbody', 'handlers', 'cases'):
+            for child in getattr(node, field, ()):
+                self.visit(child)
+    
+    def visit_Import(self, node):
+        for alias in node.names:
+            self.result['imports'].append(alias.name)
+    
+    def visit_ImportFrom(self, node):
+        if node.module:
+            self.result['imports'].append(node.module)
+    
+    def visit_ClassDef(self, node):
+        self.result['classes'].append(node.name)
+    
+    def visit_FunctionDef(self, node):
+        self.result['functions'].append(node.name)
+    
+    def visit_AsyncFunctionDef(self, node):
+        pass
+
 
 def analyze_python_file(file_path):
     """
@@ -33,26 +124,22 @@ def analyze_python_file(file_path):
     }
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            tree = ast.parse(content)
-            
-        for node in ast.walk(tree):
-            # Extract imports
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    result['imports'].append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    result['imports'].append(node.module)
-            
-            # Extract classes
-            elif isinstance(node, ast.ClassDef):
-                result['classes'].append(node.name)
-            
-            # Extract top-level functions
-            elif isinstance(node, ast.FunctionDef):
-                result['functions'].append(node.name)
+        if os.path.getsize(file_path) > _MAX_PARSE_BYTES:
+            print(f"Skipping {file_path}: larger than {_MAX_PARSE_BYTES} bytes")
+            return result
+        
+        with open(file_path, 'rb') as f:
+            head = f.read(_BINARY_SNIFF_BYTES)
+            if b'\x00' in head:
+                print(f"Skipping {file_path}: binary content")
+                return result
+            content = head + f.read()
+        
+        # ast.parse decodes the bytes itself, honouring any PEP 263 coding cookie
+        tree = ast.parse(content, type_comments=False)
+        
+        # Top-level imports, classes and functions in a single visit
+        _DefinitionCollector(result).visit(tree)
                 
     except Exception as e:
         print(f"Error analyzing {file_path}: {str(e)}")
@@ -76,28 +163,17 @@ def analyze_javascript_file(file_path):
     }
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract imports (ES6 style)
-        import_pattern = r'import\s+.*?\s+from\s+[\'"](.+?)[\'"]'
-        imports = re.findall(import_pattern, content)
-        result['imports'].extend(imports)
-        
-        # Extract require statements
-        require_pattern = r'require\([\'"](.+?)[\'"]\)'
-        requires = re.findall(require_pattern, content)
-        result['imports'].extend(requires)
-        
-        # Extract function declarations
-        func_pattern = r'function\s+(\w+)\s*\('
-        functions = re.findall(func_pattern, content)
-        result['functions'].extend(functions)
-        
-        # Extract arrow functions
-        arrow_pattern = r'const\s+(\w+)\s*=\s*\(.*?\)\s*=>'
-        arrow_funcs = re.findall(arrow_pattern, content)
-        result['functions'].extend(arrow_funcs)
+        # Bucket every match from a single scan by the group that matched
+        found = {'import': [], 'require': [], 'function': [], 'arrow': []}
+        with open(file_path, 'rb') as f, _map_source(f) as content:
+            for match in _JS_ALL_RE.finditer(content):
+                found[match.lastgroup].append(match.group(match.lastgroup).decode('utf-8', 'replace'))
+        
+        # ES6 imports before require statements, declarations before arrow functions
+        result['imports'].extend(found['import'])
+        result['imports'].extend(found['require'])
+        result['functions'].extend(found['function'])
+        result['functions'].extend(found['arrow'])
         
     except Exception as e:
         print(f"Error analyzing {file_path}: {str(e)}")
@@ -122,23 +198,18 @@ def analyze_java_file(file_path):
     }
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract imports
-        import_pattern = r'import\s+([\w.]+);'
-        imports = re.findall(import_pattern, content)
-        result['imports'].extend(imports)
-        
-        # Extract class names
-        class_pattern = r'(?:public|private|protected)?\s*class\s+(\w+)'
-        classes = re.findall(class_pattern, content)
-        result['classes'].extend(classes)
-        
-        # Extract method names
-        method_pattern = r'(?:public|private|protected)\s+(?:static\s+)?[\w\<\>\[\]]+\s+(\w+)\s*\('
-        methods = re.findall(method_pattern, content)
-        result['methods'].extend(methods)
+        with open(file_path, 'rb') as f, _map_source(f) as content:
+            # Extract imports
+            imports = _JAVA_IMPORT_RE.findall(content)
+            result['imports'].extend(_decode_all(imports))
+            
+            # Extract class names
+            classes = _JAVA_CLASS_RE.findall(content)
+            result['classes'].extend(_decode_all(classes))
+            
+            # Extract method names
+            methods = _JAVA_METHOD_RE.findall(content)
+            result['methods'].extend(_decode_all(methods))
         
     except Exception as e:
         print(f"Error analyzing {file_path}: {str(e)}")
@@ -164,28 +235,10 @@ def analyze_sql_file(file_path):
     }
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract table names
-        table_pattern = r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)'
-        tables = re.findall(table_pattern, content, re.IGNORECASE)
-        result['tables'].extend(tables)
-        
-        # Extract procedure names
-        proc_pattern = r'CREATE\s+(?:OR\s+REPLACE\s+)?PROCEDURE\s+(\w+)'
-        procedures = re.findall(proc_pattern, content, re.IGNORECASE)
-        result['procedures'].extend(procedures)
-        
-        # Extract function names
-        func_pattern = r'CREATE\s+(?:OR\s+REPLACE\s+)?FUNCTION\s+(\w+)'
-        functions = re.findall(func_pattern, content, re.IGNORECASE)
-        result['functions'].extend(functions)
-        
-        # Extract view names
-        view_pattern = r'CREATE\s+(?:OR\s+REPLACE\s+)?VIEW\s+(\w+)'
-        views = re.findall(view_pattern, content, re.IGNORECASE)
-        result['views'].extend(views)
+        # Table, procedure, function and view names from a single scan
+        with open(file_path, 'rb') as f, _map_source(f) as content:
+            for match in _SQL_ALL_RE.finditer(content):
+                result[match.lastgroup].append(match.group(match.lastgroup).decode('utf-8', 'replace'))
         
     except Exception as e:
         print(f"Error analyzing {file_path}: {str(e)}")
@@ -193,6 +246,249 @@ def analyze_sql_file(file_path):
     return result
 
 
+# Analyzer and diagram label for each supported extension
+_ANALYZERS = {
+    '.py': ('Python', analyze_python_file),
+    '.js': ('JavaScript', analyze_javascript_file),
+    '.java': ('Java', analyze_java_file),
+    '.sql': ('SQL', analyze_sql_file)
+}
+
+# Below this many files, worker start-up costs more than parallel analysis saves
+_MIN_PARALLEL_FILES = 8
+
+# On-disk cache of per-file analyses keyed by absolute path and (mtime_ns, size);
+# set DOCGEN_NOCACHE to bypass. Bump the version whenever an analyzer's output changes.
+_ANALYSIS_CACHE_PATH = os.path.join('.cache', 'architecture', 'analysis.json')
+_ANALYSIS_CACHE_VERSION = 3
+
+# Non-source directories skipped while scanning a project (hidden ones are skipped too)
+_SKIP_DIRS = frozenset({'__pycache__', 'node_modules', 'venv', 'env'})
+
+
+def _iter_source_files(root, extensions):
+    """
+    Yield (path, extension) for files under root whose extension is in extensions.
+    
+    Visits directories in the same order as os.walk (each directory's files,
+    then its subdirectories depth-first) but reuses the DirEntry type info from
+    scandir and only builds paths for matching files.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir():
+                        # Like os.walk, symlinked directories are listed but not followed
+                        if not name.startswith('.') and name not in _SKIP_DIRS and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    else:
+                        ext = os.path.splitext(name)[1]
+                        if ext in extensions:
+                            yield entry.path, ext
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def _analyze_file(task):
+    """
+    Analyze one source file with the analyzer for its extension.
+    
+    Runs in a worker process, so it must stay a picklable top-level function.
+    
+    Args:
+        task (tuple): (file_path, extension)
+        
+    Returns:
+        dict: {'type': language name, 'analysis': analyzer result, with each import listed once}
+    """
+    file_path, ext = task
+    file_type, analyzer = _ANALYZERS[ext]
+    analysis = analyzer(file_path)
+    analysis['imports'] = list(dict.fromkeys(analysis.get('imports', [])))
+    return {'type': file_type, 'analysis': analysis}
+
+
+def _intern_analysis(analysis):
+    """
+    Intern every name in an analysis in place.
+    
+    Results come back from worker processes or the JSON cache as fresh strings,
+    so common names such as 'os' would otherwise be stored once per file.
+    """
+    for key, names in analysis.items():
+        analysis[key] = [sys.intern(name) for name in names]
+    return analysis
+
+
+def _load_analysis_cache():
+    """Load the per-file analysis cache, or an empty one if it is missing, stale or disabled."""
+    if os.environ.get('DOCGEN_NOCACHE'):
+        return {}
+    try:
+        with open(_ANALYSIS_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != _ANALYSIS_CACHE_VERSION:
+        return {}
+    return cache.get('files', {})
+
+
+def _save_analysis_cache(files):
+    """Write the per-file analysis cache through a temp file so readers never see partial JSON."""
+    if os.environ.get('DOCGEN_NOCACHE'):
+        return
+    try:
+        os.makedirs(os.path.dirname(_ANALYSIS_CACHE_PATH), exist_ok=True)
+        tmp_path = f"{_ANALYSIS_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': _ANALYSIS_CACHE_VERSION, 'files': files}, f, ensure_ascii=False)
+        os.replace(tmp_path, _ANALYSIS_CACHE_PATH)
+    except OSError as e:
+        print(f"Error writing analysis cache: {str(e)}")
+
+
+def _analyze_files(tasks):
+    """
+    Analyze (file_path, extension) tasks, returning results in task order.
+    
+    Each file is independent and CPU-bound, so large batches use a process pool.
+    """
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if workers < 2 or len(tasks) < _MIN_PARALLEL_FILES:
+        return [_analyze_file(task) for task in tasks]
+    
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_analyze_file, tasks, chunksize=chunksize))
+
+
+def _architecture_dot_source(project_path):
+    """
+    Analyze a project and build the DOT source of its architecture diagram.
+    
+    Args:
+        project_path (str): Path to the project directory
+        
+    Returns:
+        str: DOT source text
+    """
+    # Build the DOT source directly, one line per statement, instead of
+    # going through a graphviz.Digraph call for every node and edge
+    dot_lines = ['// Project Architecture Diagram', 'digraph Architecture {']
+    
+    # Set graph attributes for clean UML look
+    dot_lines.append('\t' + _dot_attrs(rankdir='TB', splines='ortho', nodesep='0.5', ranksep='0.8'))
+    dot_lines.append('\tnode [' + _dot_attrs(shape='box', style='filled', fillcolor='#F5F0FF',
+                                             color='#E8B4F0', fontname='Arial', fontsize='10') + ']')
+    dot_lines.append('\tedge [' + _dot_attrs(color='#A8D5FF', fontname='Arial', fontsize='9') + ']')
+    
+    # Walk source files, skipping hidden and common non-source directories
+    tasks = list(_iter_source_files(project_path, _ANALYZERS))
+    
+    # Reuse cached analyses for files whose mtime and size are unchanged
+    cache = _load_analysis_cache()
+    fresh_cache = {}
+    analyzed = [None] * len(tasks)
+    misses = []
+    for idx, (file_path, _) in enumerate(tasks):
+        cache_key = os.path.abspath(file_path)
+        try:
+            stat = os.stat(file_path)
+            stamp = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            stamp = None
+        
+        cached = cache.get(cache_key)
+        if stamp is not None and cached and cached['stamp'] == stamp:
+            analyzed[idx] = cached['file_info']
+            fresh_cache[cache_key] = cached
+        else:
+            misses.append((idx, cache_key, stamp))
+    
+    # Analyze the remaining project files
+    for (idx, cache_key, stamp), file_info in zip(misses, _analyze_files([tasks[m[0]] for m in misses])):
+        analyzed[idx] = file_info
+        if stamp is not None:
+            fresh_cache[cache_key] = {'stamp': stamp, 'file_info': file_info}
+    
+    if misses or len(fresh_cache) != len(cache):
+        _save_analysis_cache(fresh_cache)
+    
+    project_files = {}
+    for (file_path, _), file_info in zip(tasks, analyzed):
+        _intern_analysis(file_info['analysis'])
+        project_files[os.path.relpath(file_path, project_path)] = file_info
+    
+    # Add nodes for each file
+    for file_path, file_info in project_files.items():
+        file_name = os.path.basename(file_path)
+        file_type = file_info['type']
+        analysis = file_info['analysis']
+        
+        # Create label with file info
+        label_parts = [f"{file_name}", f"{file_type}"]
+        
+        if file_type == 'Python':
+            if analysis['classes']:
+                label_parts.append(f"Classes: {len(analysis['classes'])}")
+            if analysis['functions']:
+                label_parts.append(f"Functions: {len(analysis['functions'])}")
+        elif file_type == 'JavaScript':
+            if analysis['functions']:
+                label_parts.append(f"Functions: {len(analysis['functions'])}")
+        elif file_type == 'Java':
+            if analysis['classes']:
+                label_parts.append(f"Classes: {len(analysis['classes'])}")
+            if analysis['methods']:
+                label_parts.append(f"Methods: {len(analysis['methods'])}")
+        elif file_type == 'SQL':
+            if analysis['tables']:
+                label_parts.append(f"Tables: {len(analysis['tables'])}")
+            if analysis['procedures']:
+                label_parts.append(f"Procedures: {len(analysis['procedures'])}")
+        
+        label = '\\n'.join(label_parts)
+        
+        # Set color based on file type
+        colors = {
+            'Python': '#E8D5FF',
+            'JavaScript': '#FFE5F1',
+            'Java': '#FFD4A3',
+            'SQL': '#D4FFE5'
+        }
+        
+        dot_lines.append(f"\t{_dot_quote(file_path)} [{_dot_attrs(label=label, fillcolor=colors.get(file_type, '#F5F0FF'))}]")
+    
+    # Index files by name without extension; the first file in project order wins
+    name_to_target = {}
+    for target_order, target_path in enumerate(project_files):
+        target_name = os.path.splitext(os.path.basename(target_path))[0]
+        name_to_target.setdefault(target_name, (target_order, target_path))
+    
+    # Add edges for dependencies
+    for file_path, file_info in project_files.items():
+        analysis = file_info['analysis']
+        imports = analysis.get('imports', [])
+        
+        # Imports are already unique per file (see _analyze_file), so each gets one lookup and one edge
+        for imp in imports:
+            # An import matches a file whose name it ends with; look up each suffix of
+            # the import instead of scanning every file, keeping the earliest match
+            matches = [name_to_target[imp[i:]] for i in range(len(imp) + 1) if imp[i:] in name_to_target]
+            if matches:
+                dot_lines.append(f"\t{_dot_quote(file_path)} -> {_dot_quote(min(matches)[1])} [label=imports]")
+    
+    dot_lines.append('}')
+    
+    return '\n'.join(dot_lines) + '\n'
+
+
 def generate_architecture_diagram(project_path='.', output_file='architecture_diagram', output_format='png'):
     """
     Generate a UML-style architecture diagram for the project.
@@ -210,104 +506,8 @@ def generate_architecture_diagram(project_path='.', output_file='architecture_di
         return None
     
     try:
-        # Create a new directed graph
-        dot = graphviz.Digraph(
-            name='Architecture',
-            comment='Project Architecture Diagram',
-            format=output_format,
-            engine='dot'
-        )
-        
-        # Set graph attributes for clean UML look
-        dot.attr(rankdir='TB', splines='ortho', nodesep='0.5', ranksep='0.8')
-        dot.attr('node', shape='box', style='filled', fillcolor='#F5F0FF', 
-                 color='#E8B4F0', fontname='Arial', fontsize='10')
-        dot.attr('edge', color='#A8D5FF', fontname='Arial', fontsize='9')
-        
-        # Analyze project files
-        project_files = {}
-        supported_extensions = {'.py', '.js', '.java', '.sql'}
-        
-        for root, dirs, files in os.walk(project_path):
-            # Skip hidden directories and common non-source directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules', 'venv', 'env']]
-            
-            for file in files:
-                file_path = os.path.join(root, file)
-                ext = os.path.splitext(file)[1]
-                
-                if ext in supported_extensions:
-                    rel_path = os.path.relpath(file_path, project_path)
-                    
-                    if ext == '.py':
-                        analysis = analyze_python_file(file_path)
-                        project_files[rel_path] = {'type': 'Python', 'analysis': analysis}
-                    elif ext == '.js':
-                        analysis = analyze_javascript_file(file_path)
-                        project_files[rel_path] = {'type': 'JavaScript', 'analysis': analysis}
-                    elif ext == '.java':
-                        analysis = analyze_java_file(file_path)
-                        project_files[rel_path] = {'type': 'Java', 'analysis': analysis}
-                    elif ext == '.sql':
-                        analysis = analyze_sql_file(file_path)
-                        project_files[rel_path] = {'type': 'SQL', 'analysis': analysis}
-        
-        # Add nodes for each file
-        for file_path, file_info in project_files.items():
-            file_name = os.path.basename(file_path)
-            file_type = file_info['type']
-            analysis = file_info['analysis']
-            
-            # Create label with file info
-            label_parts = [f"{file_name}", f"{file_type}"]
-            
-            if file_type == 'Python':
-                if analysis['classes']:
-                    label_parts.append(f"Classes: {len(analysis['classes'])}")
-                if analysis['functions']:
-                    label_parts.append(f"Functions: {len(analysis['functions'])}")
-            elif file_type == 'JavaScript':
-                if analysis['functions']:
-                    label_parts.append(f"Functions: {len(analysis['functions'])}")
-            elif file_type == 'Java':
-                if analysis['classes']:
-                    label_parts.append(f"Classes: {len(analysis['classes'])}")
-                if analysis['methods']:
-                    label_parts.append(f"Methods: {len(analysis['methods'])}")
-            elif file_type == 'SQL':
-                if analysis['tables']:
-                    label_parts.append(f"Tables: {len(analysis['tables'])}")
-                if analysis['procedures']:
-                    label_parts.append(f"Procedures: {len(analysis['procedures'])}")
-            
-            label = '\\n'.join(label_parts)
-            
-            # Set color based on file type
-            colors = {
-                'Python': '#E8D5FF',
-                'JavaScript': '#FFE5F1',
-                'Java': '#FFD4A3',
-                'SQL': '#D4FFE5'
-            }
-            
-            dot.node(file_path, label, fillcolor=colors.get(file_type, '#F5F0FF'))
-        
-        # Add edges for dependencies
-        for file_path, file_info in project_files.items():
-            analysis = file_info['analysis']
-            imports = analysis.get('imports', [])
-            
-            for imp in imports:
-                # Try to find matching files in the project
-                for target_path in project_files.keys():
-                    target_name = os.path.splitext(os.path.basename(target_path))[0]
-                    
-                    # Check if import matches target file
-                    if imp == target_name or imp.endswith(target_name):
-                        dot.edge(file_path, target_path, label='imports')
-                        break
-        
         # Render the diagram
+        dot = graphviz.Source(_architecture_dot_source(project_path), format=output_format, engine='dot')
         output_path = dot.render(output_file, cleanup=True)
         print(f"Architecture diagram generated: {output_path}")
         return output_path
@@ -317,6 +517,65 @@ def generate_architecture_diagram(project_path='.', output_file='architecture_di
         return None
 
 
+def generate_architecture_diagrams(project_paths, output_files=None, output_format='png'):
+    """
+    Generate architecture diagrams for several projects with a single Graphviz run.
+    
+    Every project's DOT source is written to a temporary directory and then
+    rendered by one `dot -O` invocation, so the process start-up is paid once
+    rather than per diagram. Only the rendered images are moved to their output
+    paths; the DOT sources are discarded with the temporary directory.
+    
+    Args:
+        project_paths (list): Paths to the project directories
+        output_files (list): Output file names (without extension); defaults to
+            '<project folder>_architecture' for each project, with a numeric
+            suffix when two projects share a folder name
+        output_format (str): Output format ('png', 'svg', 'pdf')
+        
+    Returns:
+        list: Paths to the generated diagram files, or None if failed
+    """
+    if output_files is None:
+        output_files = []
+        seen = {}
+        for path in project_paths:
+            base = f"{os.path.basename(os.path.abspath(path))}_architecture"
+            seen[base] = seen.get(base, 0) + 1
+            output_files.append(base if seen[base] == 1 else f"{base}_{seen[base]}")
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dot_files = []
+            for idx, project_path in enumerate(project_paths):
+                dot_file = os.path.join(tmp_dir, f"{idx}.gv")
+                with open(dot_file, 'w', encoding='utf-8') as f:
+                    f.write(_architecture_dot_source(project_path))
+                dot_files.append(dot_file)
+            
+            # -O names each output after its input file plus the format extension
+            subprocess.run(['dot', f'-T{output_format}', '-O', *dot_files], check=True, capture_output=True)
+            
+            output_paths = []
+            for dot_file, output_file in zip(dot_files, output_files):
+                output_path = f"{output_file}.{output_format}"
+                shutil.move(f"{dot_file}.{output_format}", output_path)
+                output_paths.append(output_path)
+        
+        print(f"Architecture diagrams generated: {', '.join(output_paths)}")
+        return output_paths
+        
+    except FileNotFoundError:
+        print("Error: Graphviz 'dot' executable not found. Install the Graphviz system package.")
+        return None
+    except subprocess.CalledProcessError as e:
+        print(f"Error generating diagrams: {e.stderr.decode('utf-8', 'replace').strip()}")
+        return None
+    except Exception as e:
+        print(f"Error generating diagrams: {str(e)}")
+        return None
+
+
 def generate_simple_diagram(entities, output_file='entity_diagram', output_format='png'):
     """
     Generate a simple diagram showing extracted entities and their relationships.
@@ -334,19 +593,14 @@ def generate_simple_diagram(entities, output_file='entity_diagram', output_forma
         return None
     
     try:
-        # Create a new directed graph
-        dot = graphviz.Digraph(
-            name='Entities',
-            comment='Entity Relationship Diagram',
-            format=output_format,
-            engine='dot'
-        )
+        # Build the DOT source directly, one line per statement
+        dot_lines = ['// Entity Relationship Diagram', 'digraph Entities {']
         
         # Set graph attributes
-        dot.attr(rankdir='LR', splines='ortho', nodesep='0.5', ranksep='1.0')
-        dot.attr('node', shape='box', style='filled', fillcolor='#F5F0FF',
-                 color='#E8B4F0', fontname='Arial', fontsize='10')
-        dot.attr('edge', color='#A8D5FF', fontname='Arial', fontsize='9')
+        dot_lines.append('\t' + _dot_attrs(rankdir='LR', splines='ortho', nodesep='0.5', ranksep='1.0'))
+        dot_lines.append('\tnode [' + _dot_attrs(shape='box', style='filled', fillcolor='#F5F0FF',
+                                                 color='#E8B4F0', fontname='Arial', fontsize='10') + ']')
+        dot_lines.append('\tedge [' + _dot_attrs(color='#A8D5FF', fontname='Arial', fontsize='9') + ']')
         
         # Group entities by type
         entity_types = {}
@@ -358,33 +612,38 @@ def generate_simple_diagram(entities, output_file='entity_diagram', output_forma
         
         # Add nodes for each entity type group
         for entity_type, type_entities in entity_types.items():
-            with dot.subgraph(name=f'cluster_{entity_type}') as c:
-                c.attr(label=f'{entity_type}s', style='filled', fillcolor='#FEFBFF',
-                       color='#E8B4F0', fontsize='12')
+            dot_lines.append(f"\tsubgraph {_dot_quote(f'cluster_{entity_type}')} {{")
+            dot_lines.append('\t\t' + _dot_attrs(label=f'{entity_type}s', style='filled', fillcolor='#FEFBFF',
+                                                 color='#E8B4F0', fontsize='12'))
+            
+            for entity in type_entities:
+                name = entity.get('Name', 'Unknown')
+                params = entity.get('Params', [])
+                
+                # Create label
+                label_parts = [f"{name}"]
+                if params:
+                    label_parts.append(f"Params: {len(params)}")
                 
-                for entity in type_entities:
-                    name = entity.get('Name', 'Unknown')
-                    params = entity.get('Params', [])
-                    
-                    # Create label
-                    label_parts = [f"{name}"]
-                    if params:
-                        label_parts.append(f"Params: {len(params)}")
-                    
-                    label = '\\n'.join(label_parts)
-                    
-                    # Set color based on type
-                    colors = {
-                        'Function': '#E8D5FF',
-                        'Method': '#FFE5F1',
-                        'Table': '#D4FFE5',
-                        'Procedure': '#FFD4A3',
-                        'View': '#A8FFD5'
-                    }
-                    
-                    c.node(name, label, fillcolor=colors.get(entity_type, '#F5F0FF'))
+                label = '\\n'.join(label_parts)
+                
+                # Set color based on type
+                colors = {
+                    'Function': '#E8D5FF',
+                    'Method': '#FFE5F1',
+                    'Table': '#D4FFE5',
+                    'Procedure': '#FFD4A3',
+                    'View': '#A8FFD5'
+                }
+                
+                dot_lines.append(f"\t\t{_dot_quote(name)} [{_dot_attrs(label=label, fillcolor=colors.get(entity_type, '#F5F0FF'))}]")
+            
+            dot_lines.append('\t}')
+        
+        dot_lines.append('}')
         
         # Render the diagram
+        dot = graphviz.Source('\n'.join(dot_lines) + '\n', format=output_format, engine='dot')
         output_path = dot.render(output_file, cleanup=True)
         print(f"Entity diagram generated: {output_path}")
         return output_path
@@ -0,0 +1,266 @@
+"""
+Codebase Ingestion
+Walks a directory tree, collects supported source files, and extracts
+documentation from them in parallel worker processes.
+"""
+
+import os
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from python_parser import parse_python_docs
+from js_parser import parse_js_docs
+from java_parser import extract_java_docs
+from sql_parser import extract_sql_docs
+
+# Directories and files to ignore
+IGNORE_DIRS = {
+    'node_modules', '__pycache__', '.git', '.svn', 'venv', 'env',
+    'dist', 'build', '.idea', '.vscode', 'target', 'bin', 'obj'
+}
+IGNORE_FILES = {'.DS_Store', 'Thumbs.db', '.gitignore', '.gitkeep'}
+
+# Supported file extensions
+EXTENSIONS = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.java': 'java',
+    '.sql': 'sql'
+}
+
+_PARSERS = {
+    'python': parse_python_docs,
+    'javascript': parse_js_docs,
+    'java': extract_java_docs,
+    'sql': extract_sql_docs
+}
+
+# On-disk cache of parsed entities keyed by content hash; set DOCGEN_NOCACHE to bypass.
+# Bump the version whenever a parser's output format changes.
+_ENTITY_CACHE_DIR = os.path.join('.cache', 'entities')
+_ENTITY_CACHE_VERSION = 4
+
+# Below this many files, worker start-up costs more than parallel parsing saves
+_MIN_PARALLEL_FILES = 8
+
+
+def _should_ignore(name):
+    """Check if file/directory should be ignored."""
+    return name in IGNORE_DIRS or name in IGNORE_FILES or name.startswith('.')
+
+
+def _cached_parse(content, language):
+    """
+    Extract entities for one file's content, reusing a previous result for identical content.
+    
+    Args:
+        content (str): Source code of the file
+        language (str): Language key into _PARSERS
+        
+    Returns:
+        list: Extracted entities (without source_file tags)
+    """
+    parser = _PARSERS[language]
+    if os.environ.get('DOCGEN_NOCACHE'):
+        return parser(content)
+    
+    digest = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+    cache_path = os.path.join(_ENTITY_CACHE_DIR, f"v{_ENTITY_CACHE_VERSION}", language, f"{digest}.json")
+    
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+    
+    entities = parser(content)
+    
+    # Write to a per-process temp file and rename so concurrent workers never see partial JSON
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entities, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Error writing entity cache: {str(e)}")
+    
+    return entities
+
+
+def _parse_file(task):
+    """
+    Read a single file and extract its entities.
+    
+    Runs in a worker process, so it must stay a picklable top-level function.
+    
+    Args:
+        task (tuple): (file_path, language)
+        
+    Returns:
+        list: Extracted entities tagged with their source file
+    """
+    file_path, language = task
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+        
+        entities = _cached_parse(content, language)
+        
+        # Add file info to each entity
+        for entity in entities:
+            entity['source_file'] = file_path
+        
+        return entities
+    except SyntaxError as e:
+        print(f"{type(e).__name__} in {file_path}: {str(e)}")
+        return []
+    except Exception as e:
+        print(f"Error processing {file_path}: {str(e)}")
+        return []
+
+
+def _open_directory(dir_path, open_dirs):
+    """Start scanning dir_path, pushing its iterator onto the traversal stack."""
+    try:
+        open_dirs.append((dir_path, os.scandir(dir_path)))
+    except PermissionError:
+        print(f"Permission denied: {dir_path}")
+    except Exception as e:
+        print(f"Error traversing {dir_path}: {str(e)}")
+
+
+def _collect_files(root_path, tasks):
+    """
+    Traverse a directory tree and collect (path, language) pairs for code files.
+    
+    Uses an explicit stack of open directory iterators instead of recursion, so
+    deep trees cannot hit the recursion limit; files are still collected in
+    depth-first order, with each subdirectory expanded where it is listed.
+    """
+    open_dirs = []
+    _open_directory(root_path, open_dirs)
+    
+    while open_dirs:
+        dir_path, entries = open_dirs[-1]
+        try:
+            entry = next(entries, None)
+            if entry is None:
+                entries.close()
+                open_dirs.pop()
+                continue
+            
+            # Skip ignored items
+            if _should_ignore(entry.name):
+                continue
+            
+            # If directory, descend (symlinked directories are skipped to avoid cycles).
+            # DirEntry reuses the type info from the directory read, avoiding a stat per entry
+            if entry.is_dir(follow_symlinks=False):
+                _open_directory(entry.path, open_dirs)
+            
+            # If file, check extension
+            elif entry.is_file():
+                _, dot, ext = entry.name.rpartition('.')
+                language = EXTENSIONS.get(dot + ext)
+                if language:
+                    tasks.append((entry.path, language))
+        
+        except Exception as e:
+            print(f"Error traversing {dir_path}: {str(e)}")
+            entries.close()
+            open_dirs.pop()
+
+
+def codebase_fingerprint(path):
+    """
+    Hash the path, mtime and size of every supported file under path.
+    
+    Any added, removed, renamed or modified code file changes the result, so it
+    can key a cache of ingest_codebase output without reading file contents.
+    
+    Args:
+        path (str): Path to directory or single file
+        
+    Returns:
+        str: Hex digest of the file listing
+    """
+    tasks = []
+    if os.path.isdir(path):
+        _collect_files(path, tasks)
+    else:
+        tasks.append((path, None))
+    
+    hasher = hashlib.blake2b(digest_size=16)
+    for file_path, _ in tasks:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            continue
+        hasher.update(f"{file_path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode('utf-8', 'surrogatepass'))
+    
+    return hasher.hexdigest()
+
+
+def ingest_codebase(path):
+    """
+    Ingest an entire codebase from a directory path.
+    Recursively traverses directories, collects all code files, and extracts documentation.
+    
+    Files are parsed in a process pool since AST and regex extraction are
+    CPU-bound and independent per file; small codebases are parsed inline.
+    Results are cached on disk by content hash, so unchanged files are not
+    re-parsed on later runs.
+    
+    Args:
+        path (str): Path to directory or single file
+        
+    Returns:
+        dict: Structured data grouped by language with extracted entities
+        {
+            'python': {'files': [...], 'entities': [...]},
+            'javascript': {'files': [...], 'entities': [...]},
+            'java': {'files': [...], 'entities': [...]},
+            'sql': {'files': [...], 'entities': [...]},
+            'summary': {'total_files': int, 'total_entities': int}
+        }
+    """
+    # Initialize result structure
+    result = {
+        'python': {'files': [], 'entities': []},
+        'javascript': {'files': [], 'entities': []},
+        'java': {'files': [], 'entities': []},
+        'sql': {'files': [], 'entities': []},
+        'summary': {'total_files': 0, 'total_entities': 0}
+    }
+    
+    # Check if path is file or directory
+    tasks = []
+    if os.path.isfile(path):
+        # Single file
+        _, ext = os.path.splitext(path)
+        if ext in EXTENSIONS:
+            tasks.append((path, EXTENSIONS[ext]))
+    
+    elif os.path.isdir(path):
+        # Directory - traverse recursively
+        _collect_files(path, tasks)
+    
+    else:
+        raise ValueError(f"Invalid path: {path}")
+    
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if workers < 2 or len(tasks) < _MIN_PARALLEL_FILES:
+        parsed = [_parse_file(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = list(executor.map(_parse_file, tasks, chunksize=chunksize))
+    
+    for (file_path, language), entities in zip(tasks, parsed):
+        result[language]['files'].append(file_path)
+        result[language]['entities'].extend(entities)
+        result['summary']['total_files'] += 1
+        result['summary']['total_entities'] += len(entities)
+    
+    return result
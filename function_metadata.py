@@ -0,0 +1,561 @@
+"""
+Function Metadata Extractor
+Extracts per-function metadata (parameters, docs, source, usage examples) from
+Python, JavaScript, Java, and SQL source code for the interactive HTML report.
+"""
+
+import os
+import ast
+import re
+import bisect
+import hashlib
+import importlib.util
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+
+# Precompiled regex patterns used by extract_function_metadata
+_JS_FUNC = re.compile(r'function\s+(\w+)\s*\((.*?)\)\s*\{')
+_JS_ARROW = re.compile(r'const\s+(\w+)\s*=\s*\((.*?)\)\s*=>')
+_JSDOC = re.compile(r'/\*\*(.*?)\*/', re.DOTALL)
+_JAVA_METHOD = re.compile(r'(public|private|protected)?\s*(static)?\s*(\w+)\s+(\w+)\s*\((.*?)\)\s*\{')
+_SQL_FUNC = re.compile(r'CREATE\s+(FUNCTION|PROCEDURE)\s+(\w+)\s*\((.*?)\)', re.IGNORECASE | re.DOTALL)
+_SQL_END = re.compile(r'END\s*;', re.IGNORECASE)
+_BRACES = re.compile(r'[{}]')
+_PARAM_NAME_END = re.compile(r'[=:]')
+# Leading whitespace/asterisks and trailing whitespace on each doc comment line
+_DOC_STRIP = re.compile(r'^[^\S\n]*\**[^\S\n]*|[^\S\n]+$', re.MULTILINE)
+
+# Usage example templates keyed by language
+_USAGE_TEMPLATES = {
+    'python': "# Example usage:\nresult = {name}({params})\nprint(result)",
+    'javascript': "// Example usage:\nconst result = {name}({params});\nconsole.log(result);",
+    'java': "// Example usage:\nObject result = {name}({params});\nSystem.out.println(result);",
+    'sql_args': "-- Example usage:\nSELECT {name}({params});",
+    'sql_noargs': "-- Example usage:\nCALL {name}();",
+}
+_USAGE_TEMPLATE_DEFAULT = "// Example: {name}({params})"
+
+# Bounded LRU memo of extraction results keyed by source content hash
+_METADATA_CACHE = OrderedDict()
+_METADATA_CACHE_SIZE = 256
+_METADATA_CACHE_LOCK = threading.Lock()
+
+# Optional on-disk Parquet cache so parse results survive restarts (requires pyarrow)
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+# Bump the version whenever _extract_function_metadata's output changes
+_DISK_CACHE_VERSION = 2
+_DISK_CACHE_DIR = os.path.join('.cache', 'function_metadata', f"v{_DISK_CACHE_VERSION}")
+_DISK_CACHE_MAX_FILES = 1024
+# Eviction trims to this many files, so the directory is only rescanned once per
+# batch of new entries rather than on every write past the bound
+_DISK_CACHE_TRIM_TO = _DISK_CACHE_MAX_FILES * 3 // 4
+# Files believed to be in the cache directory; None until first counted
+_disk_cache_count = None
+
+
+@dataclass(slots=True, frozen=True)
+class FunctionMetadata:
+    """
+    Metadata for one extracted function, kept in slots instead of a per-instance dict.
+    
+    Frozen because cached results are shared between callers.
+    """
+    name: str
+    params: tuple
+    docstring: str
+    source_code: str
+    usage_example: str
+    language: str
+    type: str
+    
+    def __getitem__(self, key):
+        """Support dict-style access so report code can take these or plain dicts."""
+        return getattr(self, key)
+
+
+def generate_usage_template(func_name, params, language='python'):
+    """
+    Generate a usage example template for a function.
+    
+    Args:
+        func_name (str): Name of the function
+        params (list): List of parameter names
+        language (str): Programming language ('python', 'javascript', 'java', 'sql')
+    
+    Returns:
+        str: Usage example template
+    """
+    # Create parameter placeholders
+    param_placeholders = []
+    for param in params or ():
+        # Remove default values and type hints
+        if '=' in param or ':' in param:
+            param = _PARAM_NAME_END.split(param, 1)[0]
+        clean_param = param.strip()
+        if clean_param and clean_param not in ('self', 'cls'):
+            param_placeholders.append(clean_param)
+    
+    params_str = ', '.join(param_placeholders)
+    
+    # Generate language-specific templates
+    if language == 'sql':
+        template = _USAGE_TEMPLATES['sql_args' if params_str else 'sql_noargs']
+    else:
+        template = _USAGE_TEMPLATES.get(language, _USAGE_TEMPLATE_DEFAULT)
+    return template.format(name=func_name, params=params_str)
+
+
+def _newline_offsets(source_code):
+    """Return the sorted offsets of every newline, for bisect-based line lookups."""
+    return [m.start() for m in re.finditer('\n', source_code)]
+
+
+def _find_closing_brace(source_code, start):
+    """
+    Find the end of a brace-delimited body whose opening brace ends just before start.
+    
+    Only brace characters are visited; everything in between is skipped by the
+    regex engine instead of a per-character Python loop.
+    
+    Returns:
+        int: Offset just past the matching closing brace, or len(source_code) if unbalanced
+    """
+    brace_count = 1
+    for brace in _BRACES.finditer(source_code, start):
+        if brace.group() == '{':
+            brace_count += 1
+        else:
+            brace_count -= 1
+            if brace_count == 0:
+                return brace.end()
+    return len(source_code)
+
+
+def _doc_comment_index(source_code):
+    """
+    Scan /** ... */ comments once, returning their end offsets and bodies.
+    
+    Returns:
+        tuple: (sorted list of end offsets, list of comment bodies)
+    """
+    doc_ends = []
+    doc_texts = []
+    for match in _JSDOC.finditer(source_code):
+        doc_ends.append(match.end())
+        doc_texts.append(match.group(1))
+    return doc_ends, doc_texts
+
+
+def _preceding_doc_comment(doc_ends, doc_texts, pos):
+    """Return the body of the last doc comment ending at or before pos, or None."""
+    idx = bisect.bisect_right(doc_ends, pos) - 1
+    return doc_texts[idx] if idx >= 0 else None
+
+
+def _iter_function_defs(node):
+    """
+    Yield function definitions in source order from module and class level.
+    
+    Only statement children are followed, so expression subtrees and function
+    bodies are never walked.
+    """
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, ast.FunctionDef):
+            yield child
+        elif isinstance(child, (ast.stmt, ast.excepthandler)) and not isinstance(child, ast.AsyncFunctionDef):
+            yield from _iter_function_defs(child)
+
+
+def _slice_lines(source_code, newline_offsets, first, last):
+    """Return lines first..last (0-based, inclusive) as a single slice of source_code."""
+    start = newline_offsets[first - 1] + 1 if first > 0 else 0
+    end = newline_offsets[last] if last < len(newline_offsets) else len(source_code)
+    return source_code[start:end]
+
+
+def _metadata_cache_key(source_code, language, limit):
+    """Key the metadata cache on a content digest rather than the full source string."""
+    digest = hashlib.blake2b(source_code.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    return (digest, language, limit)
+
+
+def _disk_cache_path(key):
+    """Return the Parquet file path for a cache key."""
+    digest, language, limit = key
+    return os.path.join(_DISK_CACHE_DIR, f"{digest.hex()}-{language}-{limit}.parquet")
+
+
+def _disk_cache_read(key):
+    """Load a cached result from disk, or None if it is missing or unreadable."""
+    path = _disk_cache_path(key)
+    if not PYARROW_AVAILABLE or not os.path.exists(path):
+        return None
+    
+    try:
+        import pyarrow.parquet as pq
+        rows = pq.read_table(path).to_pylist()
+        # Refresh mtime so eviction treats this entry as recently used
+        os.utime(path)
+    except Exception:
+        return None
+    
+    return [FunctionMetadata(**dict(row, params=tuple(row['params']))) for row in rows]
+
+
+def _disk_cache_entries():
+    """List the Parquet files currently in the disk cache directory."""
+    return [entry for entry in os.scandir(_DISK_CACHE_DIR) if entry.name.endswith('.parquet')]
+
+
+def _disk_cache_write(key, result):
+    """
+    Persist a result as Parquet and evict the oldest files beyond the size bound.
+    
+    The file count is tracked in memory, so a write only lists the directory the
+    first time and when the bound is exceeded; eviction then trims well below
+    the bound. Other processes sharing the directory can make the count drift,
+    which only delays or advances the next trim.
+    """
+    global _disk_cache_count
+    if not PYARROW_AVAILABLE:
+        return
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from dataclasses import asdict
+        
+        os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+        path = _disk_cache_path(key)
+        is_new = not os.path.exists(path)
+        rows = [dict(asdict(func), params=list(func.params)) for func in result]
+        pq.write_table(pa.Table.from_pylist(rows), path, compression='zstd')
+        
+        with _METADATA_CACHE_LOCK:
+            if _disk_cache_count is None:
+                _disk_cache_count = len(_disk_cache_entries())
+            elif is_new:
+                _disk_cache_count += 1
+            if _disk_cache_count <= _DISK_CACHE_MAX_FILES:
+                return
+            
+            entries = _disk_cache_entries()
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            excess = max(0, len(entries) - _DISK_CACHE_TRIM_TO)
+            for entry in entries[:excess]:
+                os.remove(entry.path)
+            _disk_cache_count = len(entries) - excess
+    except Exception as e:
+        print(f"Error writing metadata cache: {str(e)}")
+
+
+def _metadata_cache_get(key):
+    """Return a cached result and mark it most recently used, or None on a miss."""
+    with _METADATA_CACHE_LOCK:
+        result = _METADATA_CACHE.get(key)
+        if result is not None:
+            _METADATA_CACHE.move_to_end(key)
+            return result
+    
+    # Fall back to the on-disk cache and promote hits into memory
+    result = _disk_cache_read(key)
+    if result is not None:
+        _memory_cache_put(key, result)
+    return result
+
+
+def _memory_cache_put(key, result):
+    """Store a result in memory, evicting the least recently used entry once full."""
+    with _METADATA_CACHE_LOCK:
+        _METADATA_CACHE[key] = result
+        _METADATA_CACHE.move_to_end(key)
+        if len(_METADATA_CACHE) > _METADATA_CACHE_SIZE:
+            _METADATA_CACHE.popitem(last=False)
+
+
+def _metadata_cache_put(key, result):
+    """Store a result in memory and, when pyarrow is installed, on disk."""
+    _memory_cache_put(key, result)
+    _disk_cache_write(key, result)
+
+
+def extract_function_metadata(source_code, language='python', limit=5):
+    """
+    Extract detailed metadata for functions including source code and usage examples.
+    
+    Results are memoized by content hash, so identical sources are parsed once.
+    
+    Args:
+        source_code (str): Source code to parse
+        language (str): Programming language
+        limit (int): Maximum number of functions to extract (default: 5)
+    
+    Returns:
+        list: List of FunctionMetadata records
+    """
+    key = _metadata_cache_key(source_code, language, limit)
+    functions = _metadata_cache_get(key)
+    if functions is None:
+        functions = _extract_function_metadata(source_code, language, limit)
+        _metadata_cache_put(key, functions)
+    return functions
+
+
+def _extract_function_metadata(source_code, language, limit):
+    """Parse source_code for function metadata without consulting the cache."""
+    functions = []
+    
+    try:
+        if language == 'python':
+            # Parse Python using AST
+            tree = ast.parse(source_code)
+            newline_offsets = _newline_offsets(source_code)
+            
+            for node in islice(_iter_function_defs(tree), limit):
+                # Extract function name
+                func_name = node.name
+                
+                # Extract parameters
+                params = []
+                for arg in node.args.args:
+                    param_name = arg.arg
+                    # Include type annotation if present
+                    if arg.annotation:
+                        param_name += f": {ast.unparse(arg.annotation)}"
+                    params.append(param_name)
+                
+                # Extract docstring
+                docstring = ast.get_docstring(node) or "No documentation available"
+                
+                # Extract function body source code
+                start_line = node.lineno - 1
+                end_line = node.end_lineno if hasattr(node, 'end_lineno') else start_line + 1
+                source_body = _slice_lines(source_code, newline_offsets, start_line, end_line - 1)
+                
+                # Generate usage example
+                usage_example = generate_usage_template(func_name, params, 'python')
+                
+                functions.append(FunctionMetadata(
+                    name=func_name,
+                    params=tuple(params),
+                    docstring=docstring,
+                    source_code=source_body,
+                    usage_example=usage_example,
+                    language='python',
+                    type='function'
+                ))
+        
+        elif language == 'javascript':
+            newline_offsets = _newline_offsets(source_code)
+            doc_ends, doc_texts = _doc_comment_index(source_code)
+            
+            # Regular function pattern
+            for match in islice(_JS_FUNC.finditer(source_code), limit):
+                func_name = match.group(1)
+                params_str = match.group(2)
+                params = [p.strip() for p in params_str.split(',') if p.strip()]
+                
+                # Find function body
+                start_pos = match.start()
+                start_line = bisect.bisect_left(newline_offsets, start_pos)
+                
+                # Find matching closing brace
+                pos = _find_closing_brace(source_code, match.end())
+                
+                end_line = bisect.bisect_left(newline_offsets, pos)
+                source_body = _slice_lines(source_code, newline_offsets, start_line, end_line)
+                
+                # Try to find JSDoc comment
+                last_jsdoc = _preceding_doc_comment(doc_ends, doc_texts, start_pos)
+                docstring = "No documentation available"
+                if last_jsdoc is not None:
+                    docstring = _DOC_STRIP.sub('', last_jsdoc.strip())
+                
+                usage_example = generate_usage_template(func_name, params, 'javascript')
+                
+                functions.append(FunctionMetadata(
+                    name=func_name,
+                    params=tuple(params),
+                    docstring=docstring,
+                    source_code=source_body,
+                    usage_example=usage_example,
+                    language='javascript',
+                    type='function'
+                ))
+            
+            # Arrow functions
+            for match in islice(_JS_ARROW.finditer(source_code), max(0, limit - len(functions))):
+                func_name = match.group(1)
+                params_str = match.group(2)
+                params = [p.strip() for p in params_str.split(',') if p.strip()]
+                
+                start_pos = match.start()
+                start_line = bisect.bisect_left(newline_offsets, start_pos)
+                
+                # Find end of arrow function (semicolon or newline)
+                end_pos = source_code.find(';', match.end())
+                if end_pos == -1:
+                    end_pos = source_code.find('\n\n', match.end())
+                if end_pos == -1:
+                    end_pos = len(source_code)
+                
+                end_line = bisect.bisect_left(newline_offsets, end_pos)
+                source_body = _slice_lines(source_code, newline_offsets, start_line, end_line)
+                
+                usage_example = generate_usage_template(func_name, params, 'javascript')
+                
+                functions.append(FunctionMetadata(
+                    name=func_name,
+                    params=tuple(params),
+                    docstring="Arrow function - No documentation available",
+                    source_code=source_body,
+                    usage_example=usage_example,
+                    language='javascript',
+                    type='function'
+                ))
+        
+        elif language == 'java':
+            newline_offsets = _newline_offsets(source_code)
+            doc_ends, doc_texts = _doc_comment_index(source_code)
+            
+            # Java method pattern
+            for match in islice(_JAVA_METHOD.finditer(source_code), limit):
+                func_name = match.group(4)
+                params_str = match.group(5)
+                
+                # Parse parameters
+                params = []
+                if params_str.strip():
+                    for param in params_str.split(','):
+                        param = param.strip()
+                        if param:
+                            # Extract parameter name (last word)
+                            parts = param.split()
+                            if parts:
+                                params.append(parts[-1])
+                
+                start_pos = match.start()
+                start_line = bisect.bisect_left(newline_offsets, start_pos)
+                
+                # Find matching closing brace
+                pos = _find_closing_brace(source_code, match.end())
+                
+                end_line = bisect.bisect_left(newline_offsets, pos)
+                source_body = _slice_lines(source_code, newline_offsets, start_line, end_line)
+                
+                # Try to find Javadoc comment
+                last_javadoc = _preceding_doc_comment(doc_ends, doc_texts, start_pos)
+                docstring = "No documentation available"
+                if last_javadoc is not None:
+                    docstring = _DOC_STRIP.sub('', last_javadoc.strip())
+                
+                usage_example = generate_usage_template(func_name, params, 'java')
+                
+                functions.append(FunctionMetadata(
+                    name=func_name,
+                    params=tuple(params),
+                    docstring=docstring,
+                    source_code=source_body,
+                    usage_example=usage_example,
+                    language='java',
+                    type='method'
+                ))
+        
+        elif language == 'sql':
+            newline_offsets = _newline_offsets(source_code)
+            
+            # SQL function/procedure pattern
+            for match in islice(_SQL_FUNC.finditer(source_code), limit):
+                func_type = match.group(1).upper()
+                func_name = match.group(2)
+                params_str = match.group(3)
+                
+                # Parse parameters
+                params = []
+                if params_str.strip():
+                    for param in params_str.split(','):
+                        param = param.strip()
+                        if param:
+                            # Extract parameter name (first word)
+                            parts = param.split()
+                            if parts:
+                                params.append(parts[0])
+                
+                start_pos = match.start()
+                start_line = bisect.bisect_left(newline_offsets, start_pos)
+                
+                # Find END statement
+                end_match = _SQL_END.search(source_code, match.end())
+                if end_match:
+                    end_line = bisect.bisect_left(newline_offsets, end_match.end())
+                else:
+                    end_line = min(start_line + 20, len(newline_offsets))
+                
+                source_body = _slice_lines(source_code, newline_offsets, start_line, end_line)
+                
+                usage_example = generate_usage_template(func_name, params, 'sql')
+                
+                functions.append(FunctionMetadata(
+                    name=func_name,
+                    params=tuple(params),
+                    docstring=f"SQL {func_type}",
+                    source_code=source_body,
+                    usage_example=usage_example,
+                    language='sql',
+                    type=func_type.lower()
+                ))
+    
+    except Exception as e:
+        print(f"Error extracting function metadata: {str(e)}")
+    
+    return functions
+
+
+def extract_function_metadata_batch(sources, languages, limit=5):
+    """
+    Extract function metadata for many files, spreading the work across processes.
+    
+    Parsing is CPU-bound, so a process pool sidesteps the GIL. Small batches are
+    handled inline where pool start-up would cost more than it saves.
+    
+    Args:
+        sources (list): Source code strings, one per file
+        languages (list): Language of each source, aligned with sources
+        limit (int): Maximum number of functions to extract per file
+    
+    Returns:
+        list: One list of FunctionMetadata records per source, in input order
+    """
+    keys = [_metadata_cache_key(src, lang, limit) for src, lang in zip(sources, languages)]
+    results = {key: _metadata_cache_get(key) for key in keys}
+    
+    # Only parse sources that are neither cached nor duplicated within this batch
+    misses = {}
+    for key, src, lang in zip(keys, sources, languages):
+        if results[key] is None and key not in misses:
+            misses[key] = (src, lang)
+    
+    if len(misses) < 2:
+        parsed = [_extract_function_metadata(src, lang, limit) for src, lang in misses.values()]
+    else:
+        workers = min(len(misses), os.cpu_count() or 1)
+        chunksize = max(1, len(misses) // (workers * 4))
+        miss_sources = [src for src, _ in misses.values()]
+        miss_languages = [lang for _, lang in misses.values()]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = list(executor.map(
+                _extract_function_metadata,
+                miss_sources,
+                miss_languages,
+                [limit] * len(misses),
+                chunksize=chunksize
+            ))
+    
+    for key, functions in zip(misses, parsed):
+        _metadata_cache_put(key, functions)
+        results[key] = functions
+    
+    return [results[key] for key in keys]
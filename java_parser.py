@@ -1,5 +1,46 @@
 import re
 
+# Pattern compiled once at import
+# Methods with an optional preceding /** ... */ JavaDoc, matched in one pass. With a
+# JavaDoc, any modifiers (or none) may follow it and declarations without a body count;
+# without one, an access modifier and an opening '{' are required.
+# The JavaDoc body is an unrolled loop ([^*] runs, or a '*' not closing the comment)
+# rather than a lazy .*?, so it cannot run past a '*/' and never backtracks.
+_METHOD_PATTERN = re.compile(
+    r'(?:/\*\*(?P<doc>[^*]*(?:\*(?!/)[^*]*)*)\*/\s*)?'
+    r'(?(doc)(?:(?:public|private|protected|static|final)\s+)*|(?:public|private|protected)\s+(?:static\s+)?(?:final\s+)?)'
+    r'[\w\<\>\[\]]+\s+(?P<name>\w+)\s*\((?P<params>[^)]*)\)'
+    r'(?(doc)|\s*(?:throws\s+[\w\s,]+)?\s*\{)'
+)
+# Name of each comma-separated parameter: the last word before the next top-level comma,
+# skipping array brackets; commas inside generics (up to two levels deep) are not separators
+_PARAM_NAME_PATTERN = re.compile(r'(?:[^,<]|<(?:[^<>]|<[^<>]*>)*>)*?\b(\w+)(?:\s*\[\s*\])*\s*(?:,|$)')
+
+
+def _strip_javadoc_stars(javadoc):
+    """Remove the leading '*' (and one space after it) that decorates each JavaDoc line."""
+    lines = []
+    for line in javadoc.splitlines():
+        stripped = line.lstrip()
+        if stripped.startswith('*'):
+            line = stripped[1:]
+            if line[:1].isspace():
+                line = line[1:]
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def _parse_params(params_str):
+    """Return the parameter names (last word of each comma-separated type/name pair)."""
+    return _PARAM_NAME_PATTERN.findall(params_str)
+
+
+def _method_docs(javadoc):
+    """Return the cleaned JavaDoc text, or the placeholder when there is none."""
+    javadoc_clean = _strip_javadoc_stars(javadoc).strip() if javadoc is not None else ''
+    return javadoc_clean if javadoc_clean else "No documentation found"
+
+
 def extract_java_docs(source_code):
     """
     Extract documentation from Java source code using regex patterns.
@@ -12,83 +53,16 @@ def extract_java_docs(source_code):
     """
     entities = []
     
-    try:
-        # Pattern to match JavaDoc comments followed by method declarations
-        # Matches: /** ... */ followed by method signature
-        javadoc_method_pattern = r'/\*\*\s*(.*?)\s*\*/\s*(?:public|private|protected|static|\s)+[\w\<\>\[\]]+\s+(\w+)\s*\((.*?)\)'
-        
-        # Find all JavaDoc + method combinations
-        javadoc_matches = re.findall(javadoc_method_pattern, source_code, re.DOTALL)
-        
-        for match in javadoc_matches:
-            javadoc = match[0]
-            method_name = match[1]
-            params_str = match[2]
-            
-            # Clean up JavaDoc (remove * at line starts)
-            javadoc_clean = re.sub(r'^\s*\*\s?', '', javadoc, flags=re.MULTILINE).strip()
-            
-            # Parse parameters (type name pairs)
-            params_list = []
-            if params_str.strip():
-                # Split by comma and extract parameter names
-                param_parts = params_str.split(',')
-                for param in param_parts:
-                    param = param.strip()
-                    if param:
-                        # Extract parameter name (last word)
-                        parts = param.split()
-                        if parts:
-                            params_list.append(parts[-1])
-            
-            entity = {
-                "Name": method_name,
-                "Type": "Method",
-                "Params": params_list,
-                "Docs": javadoc_clean if javadoc_clean else "No documentation found"
-            }
-            entities.append(entity)
-        
-        # Pattern for methods without JavaDoc
-        # Matches: public/private/protected methods without preceding JavaDoc
-        method_pattern = r'(?:public|private|protected)\s+(?:static\s+)?(?:final\s+)?[\w\<\>\[\]]+\s+(\w+)\s*\((.*?)\)\s*(?:throws\s+[\w\s,]+)?\s*\{'
-        
-        # Find all methods
-        all_methods = re.finditer(method_pattern, source_code)
-        
-        # Track methods we've already added via JavaDoc
-        existing_methods = {entity['Name'] for entity in entities}
-        
-        for match in all_methods:
-            method_name = match.group(1)
-            params_str = match.group(2)
-            
-            # Skip if already added with JavaDoc
-            if method_name in existing_methods:
-                continue
-            
-            # Parse parameters
-            params_list = []
-            if params_str.strip():
-                param_parts = params_str.split(',')
-                for param in param_parts:
-                    param = param.strip()
-                    if param:
-                        parts = param.split()
-                        if parts:
-                            params_list.append(parts[-1])
-            
-            entity = {
-                "Name": method_name,
-                "Type": "Method",
-                "Params": params_list,
-                "Docs": "No documentation found"
-            }
-            entities.append(entity)
-            
-    except Exception as e:
-        print(f"Error parsing Java code: {str(e)}")
-        return []
+    # Find all methods, with their JavaDoc if they have one
+    entities.extend(
+        {
+            "Name": match.group('name'),
+            "Type": "Method",
+            "Params": _parse_params(match.group('params')),
+            "Docs": _method_docs(match.group('doc'))
+        }
+        for match in _METHOD_PATTERN.finditer(source_code)
+    )
     
     return entities
 
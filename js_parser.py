@@ -0,0 +1,117 @@
+import re
+import bisect
+
+# Patterns compiled once at import
+_JS_JSDOC_PATTERN = re.compile(r'/\*\*(.*?)\*/', re.DOTALL)
+# Traditional and arrow functions in one alternation, so the source is scanned once
+_JS_FUNCTION_PATTERN = re.compile(
+    r'function\s+(?P<func_name>\w+)\s*\((?P<func_params>.*?)\)'
+    r'|const\s+(?P<arrow_name>\w+)\s*=\s*\((?P<arrow_params>.*?)\)\s*=>'
+)
+# Comments and string/template literals, blanked out before matching functions
+_JS_MASK_PATTERN = re.compile(
+    r'//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`',
+    re.DOTALL
+)
+_NON_NEWLINE = re.compile(r'[^\n]')
+_CAMEL_CASE_BOUNDARY = re.compile(r'([A-Z])')
+_NEWLINE = re.compile('\n')
+
+
+def _mask_comments_and_strings(source_code):
+    """Replace comments and string literals with spaces, keeping offsets and newlines intact."""
+    return _JS_MASK_PATTERN.sub(lambda m: _NON_NEWLINE.sub(' ', m.group()), source_code)
+
+
+def _jsdoc_text(jsdoc):
+    """Strip the leading '*' decoration from each line of a JSDoc body."""
+    return '\n'.join(line.strip().lstrip('*').strip() for line in jsdoc.strip().split('\n'))
+
+
+def _preceding_line_comments(source_code, newline_offsets, func_line):
+    """Collect // comments from the up to three lines before func_line, sliced straight from source_code."""
+    comment_lines = []
+    for i in range(max(0, func_line - 3), func_line):
+        start = newline_offsets[i - 1] + 1 if i > 0 else 0
+        line = source_code[start:newline_offsets[i]].strip()
+        if line.startswith('//'):
+            comment_lines.append(line[2:].strip())
+    return comment_lines
+
+
+def parse_js_docs(source_code):
+    """
+    Extract function documentation from JavaScript source code using regex patterns.
+    
+    Traditional and const arrow functions are documented from the nearest
+    preceding JSDoc comment, then // comments, then a generated summary.
+    
+    Args:
+        source_code (str): JavaScript source code as a string
+        
+    Returns:
+        list: List of dictionaries containing function information
+    """
+    # Scan JSDoc comments and newlines once; each function then bisects
+    # for its nearest preceding comment and its line number
+    jsdoc_ends = []
+    jsdoc_texts = []
+    for jsdoc in _JS_JSDOC_PATTERN.finditer(source_code):
+        jsdoc_ends.append(jsdoc.end())
+        jsdoc_texts.append(jsdoc.group(1))
+    newline_offsets = [m.start() for m in _NEWLINE.finditer(source_code)]
+    
+    # Match on a masked copy so "function" inside comments and strings is ignored;
+    # names and params are still sliced from the original source
+    traditional_entities = []
+    arrow_entities = []
+    for match in _JS_FUNCTION_PATTERN.finditer(_mask_comments_and_strings(source_code)):
+        is_arrow = match.group('func_name') is None
+        name_group, params_group = ('arrow_name', 'arrow_params') if is_arrow else ('func_name', 'func_params')
+        func_name = match.group(name_group)
+        params_str = source_code[match.start(params_group):match.end(params_group)]
+        params_list = [p.strip() for p in params_str.split(',') if p.strip()]
+        
+        # Try to find JSDoc or comments before the function
+        func_start = match.start()
+        
+        # Look for JSDoc comment
+        jsdoc_idx = bisect.bisect_right(jsdoc_ends, func_start) - 1
+        if jsdoc_idx >= 0:
+            # Get the last JSDoc comment before the function
+            docs = _jsdoc_text(jsdoc_texts[jsdoc_idx])
+        else:
+            # Look for inline comments
+            func_line = bisect.bisect_left(newline_offsets, func_start)
+            comment_lines = _preceding_line_comments(source_code, newline_offsets, func_line)
+            
+            if comment_lines:
+                docs = ' '.join(comment_lines)
+            elif is_arrow:
+                # Generate basic docs
+                docs = f"Arrow function: {func_name}"
+                if params_list:
+                    docs += f"\nParameters: {', '.join(params_list)}"
+            else:
+                # Generate basic docs
+                docs = f"Function: {func_name}"
+                if params_list:
+                    docs += f"\nParameters: {', '.join(params_list)}"
+                # Convert camelCase to readable text
+                name_hint = _CAMEL_CASE_BOUNDARY.sub(r' \1', func_name).strip().lower()
+                docs += f"\nInferred purpose: {name_hint}"
+        
+        entity = {
+            "Name": func_name,
+            "Type": "Function",
+            "Params": params_list,
+            "Docs": docs
+        }
+        (arrow_entities if is_arrow else traditional_entities).append(entity)
+    
+    # Traditional functions first, then arrow functions, as before
+    entities = traditional_entities + arrow_entities
+    
+    return entities
+
+# Made with Bob
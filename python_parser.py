@@ -0,0 +1,103 @@
+import ast
+from collections import deque
+from inspect import cleandoc
+
+# Node types that can contain function definitions; expressions never can
+_STATEMENT_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def _iter_function_nodes(tree):
+    """
+    Yield function definitions in the same breadth-first order as ast.walk.
+    
+    Only statement nodes are queued, so expression subtrees are never visited.
+    """
+    queue = deque([tree])
+    while queue:
+        node = queue.popleft()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, _STATEMENT_NODES):
+                queue.append(child)
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    yield child
+
+
+def _docstring(node):
+    """Return the cleaned docstring of a function node, or None; ast.get_docstring without its type checks."""
+    first = node.body[0] if node.body else None
+    if isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant) and isinstance(first.value.value, str):
+        return cleandoc(first.value.value)
+    return None
+
+
+def parse_python_docs(source_code):
+    """
+    Extract function documentation from Python source code using AST parsing.
+    
+    Functions without a docstring fall back to preceding # comments, then to
+    a summary generated from the signature.
+    
+    Args:
+        source_code (str): Python source code as a string
+        
+    Returns:
+        list: List of dictionaries containing function information
+        
+    Raises:
+        SyntaxError: If the source cannot be parsed
+    """
+    entities = []
+    
+    tree = ast.parse(source_code)
+    # Split into lines only once a function without a docstring needs them
+    lines = None
+    
+    for node in _iter_function_nodes(tree):
+        func_name = node.name
+        args_list = [arg.arg for arg in node.args.args]
+        docstring = _docstring(node)
+        
+        # If no docstring, try to extract inline comments or generate basic docs
+        if docstring is None:
+            # Try to find comments before the function
+            if hasattr(node, 'lineno') and node.lineno > 1:
+                if lines is None:
+                    lines = source_code.split('\n')
+                comment_lines = []
+                for i in range(max(0, node.lineno - 4), node.lineno - 1):
+                    if i < len(lines):
+                        line = lines[i].strip()
+                        if line.startswith('#'):
+                            comment_lines.append(line[1:].strip())
+                
+                if comment_lines:
+                    docstring = ' '.join(comment_lines)
+                else:
+                    # Generate basic documentation from function signature
+                    docstring = f"Function: {func_name}"
+                    if args_list:
+                        docstring += f"\nParameters: {', '.join(args_list)}"
+                    else:
+                        docstring += "\nNo parameters"
+                    
+                    # Try to infer purpose from function name
+                    name_parts = func_name.replace('_', ' ').replace('get', 'retrieves').replace('set', 'sets').replace('calculate', 'calculates').replace('create', 'creates').replace('update', 'updates').replace('delete', 'deletes')
+                    docstring += f"\nInferred purpose: {name_parts}"
+            else:
+                # Fallback: basic signature info
+                docstring = f"Function with {len(args_list)} parameter(s)"
+                if args_list:
+                    docstring += f": {', '.join(args_list)}"
+        
+        entity = {
+            "Name": func_name,
+            "Type": "Function",
+            "Params": args_list,
+            "Docs": docstring
+        }
+        
+        entities.append(entity)
+    
+    return entities
+
+# Made with Bob
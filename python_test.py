@@ -4,7 +4,25 @@ This module provides various helper functions for common tasks.
 """
 
 import math
-from typing import List, Dict, Optional
+import itertools
+from typing import Iterable, Iterator, List, Dict, Optional
+
+# NumPy is optional; DataProcessor uses vectorized reductions when it is available
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Numba is optional too; when present, normalize runs as one compiled loop
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many elements, converting to a NumPy array costs more than it saves
+_NUMPY_MIN_SIZE = 64
 
 
 def calculate_average(numbers: List[float]) -> float:
@@ -52,6 +70,18 @@ def filter_even_numbers(numbers: List[int]) -> List[int]:
         >>> filter_even_numbers([1, 2, 3, 4, 5, 6])
         [2, 4, 6]
     """
+    # Only lists of plain ints take the mask; bools, floats, strings and mixed
+    # inputs keep the exact % semantics below (NumPy would coerce bools to int)
+    if (NUMPY_AVAILABLE and len(numbers) >= _NUMPY_MIN_SIZE
+            and all(type(num) is int for num in numbers)):
+        try:
+            arr = np.asarray(numbers)
+        except OverflowError:
+            # Ints too large for any NumPy integer type stay on the pure-Python path
+            pass
+        else:
+            if arr.dtype.kind in 'iu':
+                return arr[(arr & 1) == 0].tolist()
     return [num for num in numbers if num % 2 == 0]
 
 
@@ -68,7 +98,7 @@ def calculate_distance(x1: float, y1: float, x2: float, y2: float) -> float:
     Returns:
         The Euclidean distance between the two points
     """
-    return math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+    return math.hypot(x2 - x1, y2 - y1)
 
 
 def merge_dictionaries(dict1: Dict, dict2: Dict) -> Dict:
@@ -83,9 +113,7 @@ def merge_dictionaries(dict1: Dict, dict2: Dict) -> Dict:
         A new dictionary containing all key-value pairs from both inputs.
         If keys overlap, values from dict2 take precedence.
     """
-    result = dict1.copy()
-    result.update(dict2)
-    return result
+    return {**dict1, **dict2}
 
 
 def validate_email(email: str) -> bool:
@@ -98,7 +126,12 @@ def validate_email(email: str) -> bool:
     Returns:
         True if email format is valid, False otherwise
     """
-    return '@' in email and '.' in email.split('@')[1]
+    at = email.find('@')
+    if at == -1:
+        return False
+    # Look for the dot only up to a second '@', the part split('@')[1] would give
+    end = email.find('@', at + 1)
+    return email.find('.', at + 1, end if end != -1 else len(email)) != -1
 
 
 def chunk_list(data: List, chunk_size: int) -> List[List]:
@@ -115,6 +148,49 @@ def chunk_list(data: List, chunk_size: int) -> List[List]:
     return [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
 
 
+def iter_chunks(data: Iterable, chunk_size: int) -> Iterator[List]:
+    """
+    Lazily split any iterable into chunks of specified size.
+    
+    Unlike chunk_list, only one chunk is held in memory at a time, and the
+    input does not need to be a list (generators and files work too).
+    
+    Args:
+        data: Iterable to be chunked
+        chunk_size: Size of each chunk
+        
+    Yields:
+        Lists of chunk_size elements (last chunk may be smaller)
+    """
+    it = iter(data)
+    while True:
+        chunk = list(itertools.islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def chunk_array(data, chunk_size: int) -> List:
+    """
+    Split a NumPy array into chunks of specified size without copying.
+    
+    Args:
+        data: NumPy array (or array-like) to be chunked
+        chunk_size: Size of each chunk
+        
+    Returns:
+        List of array views into data, each containing chunk_size elements
+        (last chunk may be smaller)
+        
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("chunk_array requires numpy. Install with: pip install numpy")
+    arr = np.asarray(data)
+    return np.split(arr, range(chunk_size, len(arr), chunk_size))
+
+
 def count_occurrences(text: str, substring: str) -> int:
     """
     Count how many times a substring appears in text.
@@ -152,8 +228,41 @@ def is_palindrome(text: str) -> bool:
     Returns:
         True if text is a palindrome, False otherwise
     """
-    cleaned = text.lower().replace(' ', '')
-    return cleaned == cleaned[::-1]
+    # Compare from both ends, skipping spaces, so a mismatch returns early
+    # without building lowered or reversed copies of the text
+    i, j = 0, len(text) - 1
+    while i < j:
+        left = text[i]
+        if left == ' ':
+            i += 1
+            continue
+        right = text[j]
+        if right == ' ':
+            j -= 1
+            continue
+        if left.lower() != right.lower():
+            return False
+        i += 1
+        j -= 1
+    return True
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _normalize_kernel(arr):
+        """Rescale a float64 array to [0, 1] with one min/max pass and one output pass."""
+        lo = hi = arr[0]
+        for x in arr:
+            if x < lo:
+                lo = x
+            elif x > hi:
+                hi = x
+        range_val = hi - lo
+        out = np.empty_like(arr)
+        for i in range(arr.size):
+            # Scalar division, so zero range raises ZeroDivisionError like the Python path
+            out[i] = (arr[i] - lo) / range_val
+        return out
 
 
 class DataProcessor:
@@ -175,11 +284,21 @@ class DataProcessor:
         Returns:
             Dictionary containing mean, min, max, and count
         """
+        arr = self._as_array()
+        if arr is not None:
+            return {
+                'mean': float(arr.mean()),
+                'min': arr.min().item(),
+                'max': arr.max().item(),
+                'count': arr.size
+            }
+        
+        total, min_val, max_val, count = self._summarize()
         return {
-            'mean': sum(self.data) / len(self.data),
-            'min': min(self.data),
-            'max': max(self.data),
-            'count': len(self.data)
+            'mean': total / count,
+            'min': min_val,
+            'max': max_val,
+            'count': count
         }
     
     def normalize(self) -> List[float]:
@@ -189,9 +308,67 @@ class DataProcessor:
         Returns:
             List of normalized values
         """
-        min_val = min(self.data)
-        max_val = max(self.data)
+        arr = self._as_array()
+        if arr is not None:
+            arr = arr.astype(np.float64, copy=False)
+            if NUMBA_AVAILABLE:
+                return _normalize_kernel(arr).tolist()
+            range_val = np.ptp(arr)
+            if range_val == 0:
+                raise ZeroDivisionError("Cannot normalize data with zero range")
+            return ((arr - arr.min()) / range_val).tolist()
+        
+        _, min_val, max_val, _ = self._summarize()
         range_val = max_val - min_val
         return [(x - min_val) / range_val for x in self.data]
+    
+    def _as_array(self):
+        """
+        Build a NumPy array from the current data for the vectorized paths.
+        
+        Returns:
+            1-D int or float array, or None when NumPy is unavailable, the data
+            is small, or its elements are not all ints or all floats
+        """
+        if not NUMPY_AVAILABLE or len(self.data) < _NUMPY_MIN_SIZE:
+            return None
+        
+        # Homogeneous element types only, so results match the pure-Python path
+        element_types = {type(x) for x in self.data}
+        if element_types != {int} and element_types != {float}:
+            return None
+        
+        try:
+            arr = np.asarray(self.data)
+        except OverflowError:
+            return None
+        return arr if arr.dtype.kind in 'iuf' else None
+    
+    def _summarize(self):
+        """
+        Compute sum, min, max and count of the data in a single pass.
+        
+        Returns:
+            Tuple of (total, min, max, count)
+            
+        Raises:
+            ValueError: If the data is empty
+        """
+        it = iter(self.data)
+        try:
+            first = next(it)
+        except StopIteration:
+            raise ValueError("Cannot summarize empty data") from None
+        
+        total = min_val = max_val = first
+        count = 1
+        for x in it:
+            total += x
+            if x < min_val:
+                min_val = x
+            elif x > max_val:
+                max_val = x
+            count += 1
+        return total, min_val, max_val, count
 
 # Made with Bob
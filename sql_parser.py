@@ -1,5 +1,88 @@
 import re
 
+# Patterns compiled once at import
+# Parenthesized parameter list allowing one level of nested parens, e.g. VARCHAR(50).
+# Written as unrolled character-class loops instead of a lazy .*? so a missing ')'
+# or RETURNS fails in linear time instead of backtracking across the file.
+_PARAM_LIST = r'[^()]*(?:\([^()]*\)[^()]*)*'
+_TABLE_PATTERN = re.compile(
+    r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s*\((.*?)\);',
+    re.IGNORECASE | re.DOTALL
+)
+# CREATE PROCEDURE / FUNCTION / VIEW statements in one alternation, so the source is
+# scanned once for all three; match.lastgroup names the statement kind that matched.
+# Tables keep their own pattern: its column body may run past other statements
+# (e.g. a MySQL "...) ENGINE=InnoDB;" table), which would hide them from a shared scan.
+_ROUTINE_VIEW_PATTERN = re.compile(
+    r'(?P<procedure>CREATE\s+(?:OR\s+REPLACE\s+)?PROCEDURE\s+(?P<proc_name>\w+)\s*\((?P<proc_params>' + _PARAM_LIST + r')\))'
+    r'|(?P<function>CREATE\s+(?:OR\s+REPLACE\s+)?FUNCTION\s+(?P<func_name>\w+)\s*\((?P<func_params>' + _PARAM_LIST + r')\)'
+    r'\s+RETURNS?\s+(?P<return_type>\w+))'
+    r'|(?P<view>CREATE\s+(?:OR\s+REPLACE\s+)?VIEW\s+(?P<view_name>\w+)\s+AS\s+SELECT)',
+    re.IGNORECASE
+)
+_COLUMN_PATTERN = re.compile(
+    r'(\w+)\s+(?:VARCHAR|INT|INTEGER|DECIMAL|DATE|DATETIME|TEXT|BOOLEAN|FLOAT|DOUBLE|CHAR|BIGINT|SMALLINT|TIMESTAMP)',
+    re.IGNORECASE
+)
+_PROCEDURE_PARAM_PATTERN = re.compile(
+    r'(?:IN|OUT|INOUT)?\s*(\w+)\s+(?:VARCHAR|INT|INTEGER|DECIMAL|DATE|DATETIME|TEXT|BOOLEAN|FLOAT|DOUBLE)',
+    re.IGNORECASE
+)
+_FUNCTION_PARAM_PATTERN = re.compile(
+    r'(\w+)\s+(?:VARCHAR|INT|INTEGER|DECIMAL|DATE|DATETIME|TEXT|BOOLEAN|FLOAT|DOUBLE)',
+    re.IGNORECASE
+)
+
+
+def _preceding_comment(source_code, pos, line_comments=True):
+    """
+    Find the comment that ends right before the statement starting at pos.
+    
+    Args:
+        source_code (str): SQL source code
+        pos (int): Offset where the statement begins
+        line_comments (bool): Also accept a '--' comment on the previous line
+        
+    Returns:
+        str: Comment text (a /* */ block wins over a -- line), or None if there is none
+    """
+    if pos <= 0:
+        return None
+    
+    # Work on offsets into source_code rather than copying the text before pos,
+    # so each lookup only touches the lines just above the statement
+    end = pos
+    while end > 0 and source_code[end - 1].isspace():
+        end -= 1
+    
+    # Check for multi-line comment: the earliest '/*' after the previous '*/'
+    if source_code.endswith('*/', 0, end):
+        previous_close = source_code.rfind('*/', 0, end - 2)
+        start = source_code.find('/*', max(previous_close - 1, 0), end - 2)
+        if start != -1:
+            return source_code[start + 2:end - 2].strip()
+    
+    # Check for single-line comment
+    if line_comments:
+        last_line = source_code[source_code.rfind('\n', 0, end) + 1:end].strip()
+        if last_line.startswith('--'):
+            return last_line[2:].strip()
+    
+    return None
+
+
+def _documented(comment, default="No documentation found"):
+    """Return the comment text, or default when no comment was found."""
+    return comment if comment is not None else default
+
+
+def _function_docs(comment, return_type):
+    """Combine a function's comment (if any) with its return type."""
+    if comment:
+        return f"{comment}\nReturns: {return_type}"
+    return f"Returns: {return_type}"
+
+
 def extract_sql_docs(source_code):
     """
     Extract documentation from SQL source code using regex patterns.
@@ -12,174 +95,61 @@ def extract_sql_docs(source_code):
     """
     entities = []
     
-    try:
-        # Remove multi-line comments for cleaner parsing
-        # But keep them for documentation extraction
-        
-        # Pattern 1: CREATE TABLE statements
-        # Matches: CREATE TABLE table_name (columns...)
-        table_pattern = r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s*\((.*?)\);'
-        table_matches = re.findall(table_pattern, source_code, re.IGNORECASE | re.DOTALL)
-        
-        for match in table_matches:
-            table_name = match[0]
-            columns_def = match[1]
-            
-            # Extract column names
-            column_pattern = r'(\w+)\s+(?:VARCHAR|INT|INTEGER|DECIMAL|DATE|DATETIME|TEXT|BOOLEAN|FLOAT|DOUBLE|CHAR|BIGINT|SMALLINT|TIMESTAMP)'
-            columns = re.findall(column_pattern, columns_def, re.IGNORECASE)
-            
-            # Look for comment immediately before CREATE TABLE
-            # Find the position of this CREATE TABLE statement
-            table_pos = source_code.find(f'CREATE TABLE {table_name}')
-            if table_pos == -1:
-                table_pos = source_code.upper().find(f'CREATE TABLE {table_name.upper()}')
-            
-            doc = "No documentation found"
-            if table_pos > 0:
-                # Look backwards for comment
-                before_text = source_code[:table_pos].rstrip()
-                
-                # Check for single-line comment
-                if before_text.endswith('\n') or before_text.endswith('\r\n'):
-                    lines = before_text.split('\n')
-                    if lines and lines[-1].strip().startswith('--'):
-                        doc = lines[-1].strip()[2:].strip()
-                
-                # Check for multi-line comment
-                multiline_match = re.search(r'/\*\s*(.*?)\s*\*/\s*$', before_text, re.DOTALL)
-                if multiline_match:
-                    doc = multiline_match.group(1).strip()
-            
-            entity = {
-                "Name": table_name,
-                "Type": "Table",
-                "Params": columns,
-                "Docs": doc
-            }
-            entities.append(entity)
-        
-        # Pattern 2: CREATE PROCEDURE statements
-        # Matches: CREATE PROCEDURE proc_name (params)
-        procedure_pattern = r'CREATE\s+(?:OR\s+REPLACE\s+)?PROCEDURE\s+(\w+)\s*\((.*?)\)'
-        procedure_matches = re.findall(procedure_pattern, source_code, re.IGNORECASE | re.DOTALL)
-        
-        for match in procedure_matches:
-            proc_name = match[0]
-            params_str = match[1]
-            
-            # Extract parameter names
-            param_pattern = r'(?:IN|OUT|INOUT)?\s*(\w+)\s+(?:VARCHAR|INT|INTEGER|DECIMAL|DATE|DATETIME|TEXT|BOOLEAN|FLOAT|DOUBLE)'
-            params = re.findall(param_pattern, params_str, re.IGNORECASE)
-            
-            # Look for comment immediately before CREATE PROCEDURE
-            proc_search = f'CREATE PROCEDURE {proc_name}'
-            proc_pos = source_code.upper().find(proc_search.upper())
-            
-            doc = "No documentation found"
-            if proc_pos > 0:
-                before_text = source_code[:proc_pos].rstrip()
-                
-                # Check for single-line comment
-                lines = before_text.split('\n')
-                if lines and lines[-1].strip().startswith('--'):
-                    doc = lines[-1].strip()[2:].strip()
-                
-                # Check for multi-line comment
-                multiline_match = re.search(r'/\*\s*(.*?)\s*\*/\s*$', before_text, re.DOTALL)
-                if multiline_match:
-                    doc = multiline_match.group(1).strip()
-            
-            entity = {
-                "Name": proc_name,
-                "Type": "Procedure",
-                "Params": params,
-                "Docs": doc
-            }
-            entities.append(entity)
-        
-        # Pattern 3: CREATE FUNCTION statements
-        # Matches: CREATE FUNCTION func_name (params) RETURNS type
-        function_pattern = r'CREATE\s+(?:OR\s+REPLACE\s+)?FUNCTION\s+(\w+)\s*\((.*?)\)\s+RETURNS?\s+(\w+)'
-        function_matches = re.findall(function_pattern, source_code, re.IGNORECASE | re.DOTALL)
-        
-        for match in function_matches:
-            func_name = match[0]
-            params_str = match[1]
-            return_type = match[2]
-            
-            # Extract parameter names
-            param_pattern = r'(\w+)\s+(?:VARCHAR|INT|INTEGER|DECIMAL|DATE|DATETIME|TEXT|BOOLEAN|FLOAT|DOUBLE)'
-            params = re.findall(param_pattern, params_str, re.IGNORECASE)
-            
-            # Look for comment immediately before CREATE FUNCTION
-            func_search = f'CREATE FUNCTION {func_name}'
-            func_pos = source_code.upper().find(func_search.upper())
-            
-            doc = f"Returns: {return_type}"
-            if func_pos > 0:
-                before_text = source_code[:func_pos].rstrip()
-                
-                comment_text = None
-                # Check for single-line comment
-                lines = before_text.split('\n')
-                if lines and lines[-1].strip().startswith('--'):
-                    comment_text = lines[-1].strip()[2:].strip()
-                
-                # Check for multi-line comment
-                multiline_match = re.search(r'/\*\s*(.*?)\s*\*/\s*$', before_text, re.DOTALL)
-                if multiline_match:
-                    comment_text = multiline_match.group(1).strip()
-                
-                if comment_text:
-                    doc = f"{comment_text}\nReturns: {return_type}"
-            
-            entity = {
-                "Name": func_name,
-                "Type": "Function",
-                "Params": params,
-                "Docs": doc
-            }
-            entities.append(entity)
-        
-        # Pattern 4: CREATE VIEW statements
-        # Matches: CREATE VIEW view_name AS SELECT...
-        view_pattern = r'CREATE\s+(?:OR\s+REPLACE\s+)?VIEW\s+(\w+)\s+AS\s+SELECT'
-        view_matches = re.findall(view_pattern, source_code, re.IGNORECASE)
-        
-        for view_name in view_matches:
-            # Look for comment immediately before CREATE VIEW
-            view_search = f'CREATE VIEW {view_name}'
-            view_pos = source_code.upper().find(view_search.upper())
-            if view_pos == -1:
-                view_search = f'CREATE OR REPLACE VIEW {view_name}'
-                view_pos = source_code.upper().find(view_search.upper())
-            
-            doc = "No documentation found"
-            if view_pos > 0:
-                before_text = source_code[:view_pos].rstrip()
-                
-                # Check for single-line comment
-                lines = before_text.split('\n')
-                if lines and lines[-1].strip().startswith('--'):
-                    doc = lines[-1].strip()[2:].strip()
-                
-                # Check for multi-line comment
-                multiline_match = re.search(r'/\*\s*(.*?)\s*\*/\s*$', before_text, re.DOTALL)
-                if multiline_match:
-                    doc = multiline_match.group(1).strip()
-            
-            entity = {
-                "Name": view_name,
-                "Type": "View",
-                "Params": [],
-                "Docs": doc
-            }
-            entities.append(entity)
-            
-    except Exception as e:
-        print(f"Error parsing SQL code: {str(e)}")
-        return []
+    # Each match's start() is where its statement begins, so the comment
+    # before it is looked up from there without re-searching the source.
+    # Procedures, functions and views come from one scan, grouped by kind
+    found = {'procedure': [], 'function': [], 'view': []}
+    for match in _ROUTINE_VIEW_PATTERN.finditer(source_code):
+        found[match.lastgroup].append(match)
+    
+    # Pattern 1: CREATE TABLE statements
+    # Matches: CREATE TABLE table_name (columns...)
+    # Only a /* */ comment documents a table
+    entities.extend(
+        {
+            "Name": match.group(1),
+            "Type": "Table",
+            "Params": _COLUMN_PATTERN.findall(match.group(2)),
+            "Docs": _documented(_preceding_comment(source_code, match.start(), line_comments=False))
+        }
+        for match in _TABLE_PATTERN.finditer(source_code)
+    )
+    
+    # Pattern 2: CREATE PROCEDURE statements
+    # Matches: CREATE PROCEDURE proc_name (params)
+    entities.extend(
+        {
+            "Name": match.group('proc_name'),
+            "Type": "Procedure",
+            "Params": _PROCEDURE_PARAM_PATTERN.findall(match.group('proc_params')),
+            "Docs": _documented(_preceding_comment(source_code, match.start()))
+        }
+        for match in found['procedure']
+    )
+    
+    # Pattern 3: CREATE FUNCTION statements
+    # Matches: CREATE FUNCTION func_name (params) RETURNS type
+    entities.extend(
+        {
+            "Name": match.group('func_name'),
+            "Type": "Function",
+            "Params": _FUNCTION_PARAM_PATTERN.findall(match.group('func_params')),
+            "Docs": _function_docs(_preceding_comment(source_code, match.start()), match.group('return_type'))
+        }
+        for match in found['function']
+    )
+    
+    # Pattern 4: CREATE VIEW statements
+    # Matches: CREATE VIEW view_name AS SELECT...
+    entities.extend(
+        {
+            "Name": match.group('view_name'),
+            "Type": "View",
+            "Params": [],
+            "Docs": _documented(_preceding_comment(source_code, match.start()))
+        }
+        for match in found['view']
+    )
     
     return entities
 
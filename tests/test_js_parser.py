@@ -0,0 +1,39 @@
+"""
+Tests for the JavaScript parser.
+"""
+
+from js_parser import parse_js_docs
+
+
+def _names(source_code):
+    return [entity['Name'] for entity in parse_js_docs(source_code)]
+
+
+def test_function_in_line_comment_is_dropped():
+    source = "// function commented(a) {}\nfunction real(b) { return b; }\n"
+    assert _names(source) == ['real']
+
+
+def test_function_in_block_comment_is_dropped():
+    source = "/*\nfunction commented(a) {}\nconst arrowed = (x) => x;\n*/\nfunction real(b) {}\n"
+    assert _names(source) == ['real']
+
+
+def test_function_in_string_is_dropped():
+    source = (
+        "const s = \"function quoted(a) {}\";\n"
+        "const t = 'function single(a) {}';\n"
+        "const u = `const templ = (x) => x`;\n"
+        "function real(b) {}\n"
+    )
+    assert _names(source) == ['real']
+
+
+def test_jsdoc_still_documents_following_function():
+    source = "/**\n * Adds one.\n */\nfunction addOne(n) { return n + 1; }\n"
+    entities = parse_js_docs(source)
+    assert [entity['Name'] for entity in entities] == ['addOne']
+    assert 'Adds one.' in entities[0]['Docs']
+    assert entities[0]['Params'] == ['n']
+
+# Made with Bob
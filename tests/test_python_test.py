@@ -0,0 +1,31 @@
+"""
+Tests for the sample utilities in python_test.
+"""
+
+from python_test import _NUMPY_MIN_SIZE, filter_even_numbers
+
+
+def _filter_both_sides(pattern):
+    # The short list stays below the NumPy threshold; doubling it crosses it
+    short = (pattern * _NUMPY_MIN_SIZE)[:_NUMPY_MIN_SIZE - 1]
+    return filter_even_numbers(short) * 2, filter_even_numbers(short * 2)
+
+
+def test_ints_agree_across_threshold():
+    short, long = _filter_both_sides([1, 2, 3, -4, 0])
+    assert short == long
+    assert all(type(num) is int for num in long)
+
+
+def test_mixed_bool_int_agree_across_threshold():
+    short, long = _filter_both_sides([True, False, 2, 3])
+    assert short == long
+    assert [type(num) for num in long[:3]] == [bool, int, bool]
+
+
+def test_floats_agree_across_threshold():
+    short, long = _filter_both_sides([1.0, 2.0, 2.5])
+    assert short == long
+    assert all(type(num) is float for num in long)
+
+# Made with Bob